@@ -5,24 +5,39 @@ Desktop GUI for repairing metadata for MP3 and FLAC files.
 """
 
 # Standard library imports
+import bisect
+import csv
+import io
+import itertools
 import json
+import os
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
 # Third-party imports
-from mutagen.flac import FLAC
-from mutagen.mp3 import MP3
-from PySide6.QtCore import Qt, QThread, Signal, QTimer
-from PySide6.QtGui import QFont
+from PySide6.QtCore import (
+    QAbstractTableModel, QModelIndex, QObject, QRunnable, Qt, QThread,
+    QThreadPool, QTimer, Signal
+)
+from PySide6.QtGui import QBrush, QColor, QFont
 from PySide6.QtWidgets import (
-    QApplication, QComboBox, QDialog, QFileDialog, QGroupBox,
-    QHeaderView, QHBoxLayout, QInputDialog, QLabel, QLineEdit,
+    QAbstractItemView, QApplication, QComboBox, QDialog, QFileDialog,
+    QGroupBox, QHeaderView, QHBoxLayout, QInputDialog, QLabel, QLineEdit,
     QMainWindow, QMessageBox, QProgressBar, QPushButton, QCheckBox,
-    QTableWidget, QTableWidgetItem, QTextEdit, QVBoxLayout, QWidget
+    QTableView, QTextEdit, QVBoxLayout, QWidget
 )
 
+# Optional: orjson parses and serializes JSON several times faster than the
+# stdlib; fall back silently when it isn't installed (same as utils.audio_repair)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Local imports
 from utils import (
     audio_repair,
@@ -36,6 +51,21 @@ LOGS_DIR = Path('logs')
 LOGS_DIR.mkdir(exist_ok=True)
 DEFAULT_LOG_FILE = LOGS_DIR / 'metadata_repair_log.json'
 LIBRARIES_CONFIG_FILE = Path('music_libraries.json')
+MAX_WORKERS = 8  # Album-level worker threads (processing is mostly network/disk I/O)
+
+# Suffix -> album art embedder dispatch
+ART_EMBEDDERS = {
+    '.mp3': audio_repair.embed_album_art_mp3,
+    '.flac': audio_repair.embed_album_art_flac,
+    '.ogg': audio_repair.embed_album_art_ogg,
+    '.opus': audio_repair.embed_album_art_ogg,
+    '.m4a': audio_repair.embed_album_art_mp4,
+    '.mp4': audio_repair.embed_album_art_mp4,
+}
+
+# get() default distinguishing an art-cache miss from a memoized negative
+# result, which is stored as None
+_ART_CACHE_MISS = object()
 
 
 class ProcessingThread(QThread):
@@ -57,7 +87,181 @@ class ProcessingThread(QThread):
             'nfo_generated': 0,
             'filenames_fixed': 0
         }
-    
+        # Shared progress state for album worker threads
+        self._progress_lock = threading.Lock()
+        self._processed_count = 0
+        self._total_files = 0
+        self._last_update_time = 0.0
+        self._prefix_len = 0
+
+    def _report_progress(self, audio_file):
+        """Bump the shared progress counter and emit a throttled update."""
+        with self._progress_lock:
+            self._processed_count += 1
+            now = time.monotonic()
+            if (self._processed_count == self._total_files
+                    or now - self._last_update_time > 0.2):
+                progress = int(self._processed_count / self._total_files * 100)
+                self.progress_updated.emit(progress, str(audio_file)[self._prefix_len:])
+                self._last_update_time = now
+
+    def _process_album(self, files, album_art_cache, log_data, log_file,
+                       fix_filenames, repair_metadata, download_art):
+        """
+        Process one album directory's files serially on a worker thread.
+
+        Returns:
+            tuple: (counters dict, album_info dict for nfo generation,
+                    nfo_seen dict mapping directory str to whether an
+                    album.nfo existed there)
+        """
+        counters = {'success': 0, 'fail': 0, 'skipped': 0, 'fixed': 0}
+        album_info = {}
+        # Per-directory album.nfo parse results (None = no nfo file), so an
+        # album's tracks share one stat()+parse instead of one per track
+        nfo_cache = {}
+
+        for audio_file in sorted(files):
+            track_info = self._process_file(
+                audio_file, album_art_cache, log_data, log_file,
+                fix_filenames, repair_metadata, download_art, counters, nfo_cache
+            )
+
+            # Track album information for nfo generation (string keys:
+            # one setdefault lookup, cached str hashing)
+            if track_info:
+                info = album_info.setdefault(track_info.album_dir, {
+                    'metadata': track_info.album_metadata,
+                    'tracks': {}
+                })
+                if track_info.track_number and track_info.track_title:
+                    info['tracks'][track_info.track_number] = track_info.track_title
+
+            self._report_progress(audio_file)
+
+        # The album is finished: drop its art bytes so the cache only holds
+        # the albums currently in flight instead of every cover of the run
+        for info in album_info.values():
+            meta = info['metadata']
+            album_art_cache.pop(f"{meta.get('artist')}||{meta.get('album')}", None)
+
+        # Persist the log once per album instead of after every file;
+        # save_log writes atomically, and it shares a lock with the mark_*
+        # mutators, so the other workers' inserts can't race the dump
+        if repair_metadata and counters['success']:
+            audio_repair.save_log(log_data, log_file)
+
+        # Hand back which directories were already checked for album.nfo so
+        # the generation pass can skip a second stat on them
+        nfo_seen = {str(p): exists for p, (exists, _) in nfo_cache.items()}
+
+        return counters, album_info, nfo_seen
+
+    def _process_file(self, audio_file, album_art_cache, log_data, log_file,
+                      fix_filenames, repair_metadata, download_art, counters, nfo_cache):
+        """Process a single file, update counters, and return its TrackInfo (or None)."""
+        was_already_processed = audio_repair.is_file_processed(audio_file, log_data)
+        # On an incremental rescan a logged, unchanged file needs no parsing,
+        # no mutagen open, and no art work: count it and move on. Renaming and
+        # parse-only runs still walk the full path below.
+        if was_already_processed and repair_metadata and not fix_filenames:
+            counters['skipped'] += 1
+            return None
+
+        # Compute the derived Path attributes once; .suffix and .parent each
+        # re-slice the path parts on every access
+        suffix = audio_file.suffix.lower()
+        parent = audio_file.parent
+
+        # Fix filename if requested and file doesn't match format
+        if fix_filenames:
+            filename_metadata = audio_repair.parse_filename(audio_file.name)
+            if not filename_metadata or not filename_metadata.get('album'):
+                # Try to get metadata from file tags or album.nfo, parsed at
+                # most once per directory
+                if parent in nfo_cache:
+                    album_metadata = nfo_cache[parent][1]
+                else:
+                    album_nfo_path = parent / 'album.nfo'
+                    nfo_exists = album_nfo_path.exists()
+                    album_metadata = audio_repair.parse_album_nfo(album_nfo_path) if nfo_exists else None
+                    nfo_cache[parent] = (nfo_exists, album_metadata)
+
+                # Get metadata from file tags if needed: one mutagen
+                # easy-interface parse replaces the per-format ladder
+                file_metadata = audio_repair.extract_tags(audio_file)
+
+                # Try to fix filename; fix_filename returns the renamed path
+                new_path = audio_repair.fix_filename(audio_file, file_metadata, album_metadata)
+                if new_path:
+                    audio_file = new_path
+                    counters['fixed'] += 1
+
+        # Process based on options
+        if repair_metadata:
+            art_cache = album_art_cache if download_art else {}
+            result, track_info = audio_repair.repair_audio_file(
+                audio_file,
+                self.target_dir,
+                art_cache,
+                log_data,
+                log_file
+            )
+        else:
+            # Just parse metadata without repairing, but still collect for nfo generation
+            filename_metadata = audio_repair.parse_filename(audio_file.name)
+            if filename_metadata:
+                artist = filename_metadata.get('artist', '')
+                album = filename_metadata.get('album', '')
+
+                # Download and embed art if requested
+                if artist and album and download_art:
+                    album_key = f"{artist}||{album}"
+                    # One get() call: a membership check followed by indexing
+                    # can straddle another worker's eviction
+                    album_art = album_art_cache.get(album_key, _ART_CACHE_MISS)
+                    if album_art is _ART_CACHE_MISS:
+                        if audio_repair.should_retry_album_art(artist, album, log_data):
+                            # get_album_art paces itself against the API rate
+                            # limit, so no fixed sleep is needed here
+                            album_art, _ = audio_repair.get_album_art(artist, album)
+                        else:
+                            # Recent failure in the log; skip the network
+                            album_art = None
+                        album_art_cache[album_key] = album_art
+                    if album_art:
+                        embedder = ART_EMBEDDERS.get(suffix)
+                        if embedder:
+                            embedder(audio_file, album_art)
+
+                result = True
+                track_info = audio_repair.TrackInfo(
+                    album_dir=str(parent),
+                    album_metadata={
+                        'album': album,
+                        'artist': artist,
+                        'albumartist': artist,
+                        'year': '',
+                        'genre': '',
+                        'musicbrainz_release_group_id': ''
+                    },
+                    track_number=filename_metadata.get('tracknumber'),
+                    track_title=filename_metadata.get('title', '')
+                )
+            else:
+                result = False
+                track_info = None
+
+        if not result:
+            counters['fail'] += 1
+            return None
+
+        if was_already_processed:
+            counters['skipped'] += 1
+        else:
+            counters['success'] += 1
+        return track_info
+
     def run(self):
         """Process audio files."""
         try:
@@ -68,203 +272,103 @@ class ProcessingThread(QThread):
             # Load processing log
             log_file = DEFAULT_LOG_FILE
             log_data = audio_repair.load_log(log_file)
-            
-            # Find all supported audio files
-            audio_files = []
-            for ext in audio_repair.SUPPORTED_EXTENSIONS:
-                audio_files.extend(self.target_dir.rglob(f'*{ext}'))
-            
-            if not audio_files:
-                self.error_occurred.emit('No supported audio files found!')
-                return
-            
-            total_files = len(audio_files)
-            self.processing_results['total_files'] = total_files
-            
-            # Repair each file
-            album_art_cache = {}
+
+            # Hoist option lookups out of the per-file loop
+            fix_filenames = self.options.get('fix_filenames', False)
+            repair_metadata = self.options.get('repair_metadata', True)
+            download_art = self.options.get('download_art', True)
+            generate_nfo = self.options.get('generate_nfo', True)
+
+            # Find all supported audio files in one scandir pass. Parse-only
+            # runs fail immediately on any file whose name doesn't match the
+            # expected pattern, so push that filter into the walk itself and
+            # never surface those entries. Not when renaming is on, though:
+            # unparseable names are exactly the files fix_filenames exists
+            # to rename, so they must still come out of the walk.
+            name_predicate = None
+            if not repair_metadata and not fix_filenames:
+                name_predicate = lambda name: audio_repair.parse_filename(name) is not None
+
+            self._processed_count = 0
+            self._total_files = 0
+            self._last_update_time = time.monotonic()
+            # Display paths are a string slice off the target prefix instead
+            # of a Path.relative_to construction per update
+            self._prefix_len = len(os.fspath(self.target_dir).rstrip(os.sep)) + 1
+
+            album_art_cache = audio_repair.LRUCache(64)
             album_info = {}
-            
-            for idx, audio_file in enumerate(sorted(audio_files)):
-                progress = int((idx + 1) / total_files * 100)
-                current_file = str(audio_file.relative_to(self.target_dir))
-                self.progress_updated.emit(progress, current_file)
-                
-                was_already_processed = audio_repair.is_file_processed(audio_file, log_data)
-                
-                # Fix filename if requested and file doesn't match format
-                if self.options.get('fix_filenames', False):
-                    filename_metadata = audio_repair.parse_filename(audio_file.name)
-                    if not filename_metadata or not filename_metadata.get('album'):
-                        # Try to get metadata from file tags or album.nfo
-                        album_nfo_path = audio_file.parent / 'album.nfo'
-                        album_metadata = None
-                        if album_nfo_path.exists():
-                            album_metadata = audio_repair.parse_album_nfo(album_nfo_path)
-                        
-                        # Get metadata from file tags if needed
-                        file_metadata = {}
-                        suffix = audio_file.suffix.lower()
-                        try:
-                            if suffix == '.mp3':
-                                mp3_file = MP3(str(audio_file))
-                                file_metadata = {
-                                    'artist': mp3_file.get('TPE1', [''])[0] or mp3_file.get('TPE2', [''])[0],
-                                    'album': mp3_file.get('TALB', [''])[0],
-                                    'title': mp3_file.get('TIT2', [''])[0],
-                                    'tracknumber': int(mp3_file.get('TRCK', ['0'])[0].split('/')[0]) if mp3_file.get('TRCK') else 0
-                                }
-                            elif suffix == '.flac':
-                                flac_file = FLAC(str(audio_file))
-                                file_metadata = {
-                                    'artist': flac_file.get('ARTIST', [''])[0] or flac_file.get('ALBUMARTIST', [''])[0],
-                                    'album': flac_file.get('ALBUM', [''])[0],
-                                    'title': flac_file.get('TITLE', [''])[0],
-                                    'tracknumber': int(flac_file.get('TRACKNUMBER', ['0'])[0].split('/')[0]) if flac_file.get('TRACKNUMBER') else 0
-                                }
-                            elif suffix in ('.ogg', '.opus'):
-                                from mutagen import File as MutagenFile
-                                ogg_file = MutagenFile(str(audio_file))
-                                if ogg_file:
-                                    file_metadata = {
-                                        'artist': ogg_file.get('ARTIST', [''])[0] or ogg_file.get('ALBUMARTIST', [''])[0],
-                                        'album': ogg_file.get('ALBUM', [''])[0],
-                                        'title': ogg_file.get('TITLE', [''])[0],
-                                        'tracknumber': int(ogg_file.get('TRACKNUMBER', ['0'])[0].split('/')[0]) if ogg_file.get('TRACKNUMBER') else 0
-                                    }
-                            elif suffix in ('.m4a', '.mp4'):
-                                from mutagen.mp4 import MP4
-                                m4a_file = MP4(str(audio_file))
-                                file_metadata = {
-                                    'artist': m4a_file.get('\xa9ART', [''])[0] or m4a_file.get('aART', [''])[0],
-                                    'album': m4a_file.get('\xa9alb', [''])[0],
-                                    'title': m4a_file.get('\xa9nam', [''])[0],
-                                    'tracknumber': m4a_file.get('trkn', [(0, 0)])[0][0] if m4a_file.get('trkn') else 0
-                                }
-                        except:
-                            pass
-                        
-                        # Try to fix filename
-                        if audio_repair.fix_filename(audio_file, file_metadata, album_metadata):
-                            # File was renamed, need to find the new path
-                            # The fix_filename function renames the file, so we need to reconstruct the new name
-                            artist = file_metadata.get('artist', '') or (album_metadata.get('artist', '') if album_metadata else '')
-                            album = file_metadata.get('album', '') or (album_metadata.get('album', '') if album_metadata else '')
-                            track_num = file_metadata.get('tracknumber', 0)
-                            title = file_metadata.get('title', '')
-                            
-                            if artist and album and track_num and title:
-                                # Clean filename (same logic as fix_filename)
-                                def clean_filename(s: str) -> str:
-                                    invalid_chars = '<>:"/\\|?*'
-                                    for char in invalid_chars:
-                                        s = s.replace(char, '')
-                                    s = ' '.join(s.split())
-                                    return s.strip()
-                                
-                                artist = clean_filename(artist)
-                                album = clean_filename(album)
-                                title = clean_filename(title)
-                                new_name = f"{artist} - {album} - {track_num:02d} - {title}{audio_file.suffix}"
-                                audio_file = audio_file.parent / new_name
-                                self.processing_results['filenames_fixed'] = self.processing_results.get('filenames_fixed', 0) + 1
-                
-                # Process based on options
-                if self.options.get('repair_metadata', True):
-                    art_cache = album_art_cache if self.options.get('download_art', True) else {}
-                    result, metadata = audio_repair.repair_audio_file(
-                        audio_file, 
-                        self.target_dir, 
-                        art_cache,
-                        log_data, 
-                        log_file
-                    )
-                else:
-                    # Just parse metadata without repairing, but still collect for nfo generation
-                    filename_metadata = audio_repair.parse_filename(audio_file.name)
-                    if filename_metadata:
-                        artist = filename_metadata.get('artist', '')
-                        album = filename_metadata.get('album', '')
-                        
-                        # Download and embed art if requested
-                        if artist and album and self.options.get('download_art', True):
-                            album_key = f"{artist}||{album}"
-                            if album_key not in album_art_cache:
-                                album_art, _ = audio_repair.get_album_art(artist, album)
-                                album_art_cache[album_key] = album_art
-                                if album_art:
-                                    suffix = audio_file.suffix.lower()
-                                    if suffix == '.mp3':
-                                        audio_repair.embed_album_art_mp3(audio_file, album_art)
-                                    elif suffix == '.flac':
-                                        audio_repair.embed_album_art_flac(audio_file, album_art)
-                                    elif suffix in ('.ogg', '.opus'):
-                                        audio_repair.embed_album_art_ogg(audio_file, album_art)
-                                    elif suffix in ('.m4a', '.mp4'):
-                                        audio_repair.embed_album_art_mp4(audio_file, album_art)
-                                time.sleep(0.5)
-                            else:
-                                album_art = album_art_cache[album_key]
-                                if album_art:
-                                    suffix = audio_file.suffix.lower()
-                                    if suffix == '.mp3':
-                                        audio_repair.embed_album_art_mp3(audio_file, album_art)
-                                    elif suffix == '.flac':
-                                        audio_repair.embed_album_art_flac(audio_file, album_art)
-                                    elif suffix in ('.ogg', '.opus'):
-                                        audio_repair.embed_album_art_ogg(audio_file, album_art)
-                                    elif suffix in ('.m4a', '.mp4'):
-                                        audio_repair.embed_album_art_mp4(audio_file, album_art)
-                        
-                        result = True
-                        metadata = {
-                            'album_dir': audio_file.parent,
-                            'album_metadata': {
-                                'album': album,
-                                'artist': artist,
-                                'albumartist': artist,
-                                'year': '',
-                                'genre': '',
-                                'musicbrainz_release_group_id': ''
-                            },
-                            'track_number': filename_metadata.get('tracknumber'),
-                            'track_title': filename_metadata.get('title', '')
-                        }
-                    else:
-                        result = False
-                        metadata = None
-                
-                if result:
-                    if was_already_processed:
-                        self.processing_results['skipped_count'] += 1
-                    else:
-                        self.processing_results['success_count'] += 1
-                    
-                    # Track album information for nfo generation
-                    if metadata:
-                        album_dir = metadata['album_dir']
-                        if album_dir not in album_info:
-                            album_info[album_dir] = {
-                                'metadata': metadata['album_metadata'],
-                                'tracks': {}
-                            }
-                        if metadata.get('track_number') and metadata.get('track_title'):
-                            album_info[album_dir]['tracks'][metadata['track_number']] = metadata['track_title']
-                else:
-                    self.processing_results['fail_count'] += 1
-            
+            nfo_seen = {}
+
+            # Pipeline discovery and processing: an album bucket goes to the
+            # pool as soon as the walk moves past its directory, so repairs
+            # start while the rest of the tree is still being scanned and no
+            # flat list of every file is ever materialized. The running total
+            # keeps the progress bar meaningful before the scan finishes.
+            total_files = 0
+            futures = []
+            current_dir = None
+            current_bucket = []
+
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                def submit_bucket(bucket):
+                    with self._progress_lock:
+                        self._total_files = total_files
+                    futures.append(executor.submit(
+                        self._process_album, bucket, album_art_cache, log_data, log_file,
+                        fix_filenames, repair_metadata, download_art
+                    ))
+
+                for entry in audio_repair.scan_audio_files(self.target_dir, name_predicate=name_predicate):
+                    total_files += 1
+                    entry_dir = os.path.dirname(entry.path)
+                    if entry_dir != current_dir:
+                        if current_bucket:
+                            submit_bucket(current_bucket)
+                        current_dir = entry_dir
+                        current_bucket = []
+                    current_bucket.append(Path(entry.path))
+                if current_bucket:
+                    submit_bucket(current_bucket)
+
+                if not futures:
+                    self.error_occurred.emit('No supported audio files found!')
+                    return
+
+                self.processing_results['total_files'] = total_files
+                with self._progress_lock:
+                    self._total_files = total_files
+
+                for future in as_completed(futures):
+                    counters, info, seen = future.result()
+                    self.processing_results['success_count'] += counters['success']
+                    self.processing_results['fail_count'] += counters['fail']
+                    self.processing_results['skipped_count'] += counters['skipped']
+                    self.processing_results['filenames_fixed'] += counters['fixed']
+                    nfo_seen.update(seen)
+                    for album_dir, data in info.items():
+                        merged = album_info.setdefault(album_dir, {'metadata': data['metadata'], 'tracks': {}})
+                        merged['tracks'].update(data['tracks'])
+
             # Generate album.nfo files if enabled
-            if self.options.get('generate_nfo', True):
+            if generate_nfo:
                 nfo_generated = 0
+                # One timestamp for the whole batch
+                dateadded = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                 for album_dir, info in album_info.items():
-                    nfo_path = album_dir / 'album.nfo'
-                    if not nfo_path.exists():
-                        if audio_repair.generate_album_nfo(nfo_path, info['metadata'], info['tracks']):
+                    # Reuse the existence check a worker already made for this
+                    # directory instead of a second stat per album
+                    has_nfo = nfo_seen.get(album_dir)
+                    if has_nfo is None:
+                        has_nfo = (Path(album_dir) / 'album.nfo').exists()
+                    if not has_nfo:
+                        nfo_path = Path(album_dir) / 'album.nfo'
+                        if audio_repair.generate_album_nfo(nfo_path, info['metadata'], info['tracks'], dateadded):
                             nfo_generated += 1
                 self.processing_results['nfo_generated'] = nfo_generated
             
             # Final log save
-            if self.options.get('repair_metadata', True):
+            if repair_metadata:
                 audio_repair.save_log(log_data, log_file)
             
             self.finished.emit(self.processing_results)
@@ -471,8 +575,8 @@ class MainWindow(QMainWindow):
         """Load saved libraries from config file."""
         if LIBRARIES_CONFIG_FILE.exists():
             try:
-                with open(LIBRARIES_CONFIG_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                raw = LIBRARIES_CONFIG_FILE.read_bytes()
+                return orjson.loads(raw) if orjson is not None else json.loads(raw)
             except Exception as e:
                 QMessageBox.warning(self, 'Error', f'Could not load libraries: {e}')
         return {}
@@ -480,8 +584,11 @@ class MainWindow(QMainWindow):
     def save_libraries(self):
         """Save libraries to config file."""
         try:
-            with open(LIBRARIES_CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.libraries, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                payload = orjson.dumps(self.libraries, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(self.libraries, indent=2, ensure_ascii=False).encode('utf-8')
+            LIBRARIES_CONFIG_FILE.write_bytes(payload)
         except Exception as e:
             QMessageBox.warning(self, 'Error', f'Could not save libraries: {e}')
     
@@ -622,13 +729,39 @@ Filenames Fixed:    {results.get('filenames_fixed', 0)}
         dialog.exec()
 
 
+class _ReportJobSignals(QObject):
+    """Signal host for _ReportJob (QRunnable cannot carry signals itself)."""
+
+    done = Signal(int, str, str)  # job token, format, rendered report
+
+
+class _ReportJob(QRunnable):
+    """Render a report on the global thread pool and signal the text back."""
+
+    def __init__(self, token, report_format, log_data):
+        super().__init__()
+        self.signals = _ReportJobSignals()
+        self._token = token
+        self._format = report_format
+        self._log_data = log_data
+
+    def run(self):
+        if self._format == 'html':
+            report = generate_html_report(self._log_data)
+        else:
+            report = generate_text_report(self._log_data)
+        self.signals.done.emit(self._token, self._format, report)
+
+
 class ReportDialog(QDialog):
     """Dialog for generating and viewing reports."""
-    
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle('Generate Report')
         self.setGeometry(200, 200, 700, 600)
+        # Monotonic token so a slow render can't overwrite a newer one
+        self._preview_token = 0
         self.init_ui()
         self.load_log_data()
     
@@ -695,12 +828,9 @@ class ReportDialog(QDialog):
         """Load log data from file."""
         log_file = DEFAULT_LOG_FILE
         if log_file.exists():
-            try:
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    self.log_data = json.load(f)
-            except Exception as e:
-                QMessageBox.warning(self, 'Error', f'Could not load log file: {e}')
-                self.log_data = {'processed_files': {}, 'album_art': {}}
+            # load_log parses with orjson when available, which keeps dialog
+            # opening fast on multi-MB logs
+            self.log_data = audio_repair.load_log(log_file)
         else:
             self.log_data = {'processed_files': {}, 'album_art': {}}
             QMessageBox.information(self, 'No Log File', 'No log file found. Process some files first to generate a report.')
@@ -712,31 +842,56 @@ class ReportDialog(QDialog):
             return
         
         format_index = self.format_combo.currentIndex()
-        
-        if format_index == 0:  # Text
-            report = generate_text_report(self.log_data)
-            self.preview_text.setPlainText(report)
-            self.current_format = 'text'
-        elif format_index == 1:  # HTML
-            report = generate_html_report(self.log_data)
-            self.preview_text.setHtml(report)
-            self.current_format = 'html'
+
+        if format_index in (0, 1):  # Text / HTML
+            # Render off the GUI thread: full reports over a large log take
+            # long enough to freeze the dialog if built here
+            self._preview_token += 1
+            self.export_btn.setEnabled(False)
+            self.preview_text.setPlainText('Generating preview...')
+            job = _ReportJob(
+                self._preview_token,
+                'text' if format_index == 0 else 'html',
+                self.log_data
+            )
+            job.signals.done.connect(self._on_preview_ready)
+            QThreadPool.globalInstance().start(job)
+            return
         else:  # CSV
-            # For CSV, show a sample
+            # Supersede any in-flight text/html render
+            self._preview_token += 1
+            # For CSV, show a sample built with the C csv writer (proper
+            # quoting, no per-row string concatenation)
             processed_files = self.log_data.get('processed_files', {})
-            sample = "CSV Report Preview (first 10 rows):\n\n"
-            sample += "File Path,Last Processed,Has Album Art,File Modified Time\n"
-            for file_path, file_info in list(processed_files.items())[:10]:
-                sample += f"{file_path},{file_info.get('last_processed', '')},"
-                sample += f"{'Yes' if file_info.get('has_art', False) else 'No'},"
-                sample += f"{file_info.get('file_mtime', '')}\n"
+            buf = io.StringIO()
+            buf.write("CSV Report Preview (first 10 rows):\n\n")
+            writer = csv.writer(buf)
+            writer.writerow(['File Path', 'Last Processed', 'Has Album Art', 'File Modified Time'])
+            writer.writerows(
+                (file_path,
+                 audio_repair.format_log_timestamp(file_info.get('last_processed', '')),
+                 'Yes' if file_info.get('has_art', False) else 'No',
+                 file_info.get('file_mtime', ''))
+                for file_path, file_info in itertools.islice(processed_files.items(), 10)
+            )
             if len(processed_files) > 10:
-                sample += f"\n... and {len(processed_files) - 10} more rows"
-            self.preview_text.setPlainText(sample)
+                buf.write(f"\n... and {len(processed_files) - 10} more rows")
+            self.preview_text.setPlainText(buf.getvalue())
             self.current_format = 'csv'
-        
+
         self.export_btn.setEnabled(True)
-    
+
+    def _on_preview_ready(self, token, report_format, report):
+        """Show a finished off-thread render unless a newer request superseded it."""
+        if token != self._preview_token:
+            return
+        if report_format == 'html':
+            self.preview_text.setHtml(report)
+        else:
+            self.preview_text.setPlainText(report)
+        self.current_format = report_format
+        self.export_btn.setEnabled(True)
+
     def export_report(self):
         """Export report to file."""
         format_index = self.format_combo.currentIndex()
@@ -762,12 +917,10 @@ class ReportDialog(QDialog):
             try:
                 if format_index == 0:  # Text
                     report = generate_text_report(self.log_data)
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(report)
+                    Path(file_path).write_bytes(report.encode('utf-8'))
                 elif format_index == 1:  # HTML
                     report = generate_html_report(self.log_data)
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(report)
+                    Path(file_path).write_bytes(report.encode('utf-8'))
                 else:  # CSV
                     generate_csv_report(self.log_data, Path(file_path))
                 
@@ -776,15 +929,98 @@ class ReportDialog(QDialog):
                 QMessageBox.critical(self, 'Error', f'Could not save report:\n{e}')
 
 
+class FailedAlbumsModel(QAbstractTableModel):
+    """
+    Model behind the failed-albums view.
+
+    Rows are plain dicts; the view only asks for the cells it actually
+    paints, so loading hundreds of failed albums no longer constructs a
+    widget or item object per cell.
+    """
+
+    HEADERS = ['Artist', 'Album', 'MusicBrainz ID', 'Last Attempted']
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._row_by_key = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        album = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return album['artist']
+            if column == 1:
+                return album['album']
+            if column == 2:
+                if album['state'] == 'searching':
+                    return 'Searching...'
+                return album['musicbrainz_id'] or 'Not found'
+            return album['last_attempted'] or 'Unknown'
+
+        if role == Qt.ForegroundRole and column == 2:
+            # Must be a QBrush: the view ignores a bare GlobalColor enum
+            # coming through QVariant for this role
+            if album['state'] == 'searching':
+                return QBrush(QColor(Qt.blue))
+            if album['state'] == 'success':
+                return QBrush(QColor(Qt.green))
+            if not album['musicbrainz_id']:
+                return QBrush(QColor(Qt.red))
+
+        return None
+
+    def reset_rows(self, rows):
+        """Replace all rows in one model reset."""
+        self.beginResetModel()
+        self._rows = rows
+        self._row_by_key = {
+            f"{album['artist']}||{album['album']}": row
+            for row, album in enumerate(rows)
+        }
+        self.endResetModel()
+
+    def album_at(self, row):
+        return self._rows[row]
+
+    def row_for_key(self, album_key):
+        """O(1) row lookup by 'artist||album' key."""
+        return self._row_by_key.get(album_key)
+
+    def set_mb_id(self, row, mb_id, state=''):
+        """Update one row's MusicBrainz ID/state and repaint just that cell."""
+        album = self._rows[row]
+        album['musicbrainz_id'] = mb_id
+        album['state'] = state
+        cell = self.index(row, 2)
+        self.dataChanged.emit(cell, cell)
+
+
 class RetryAlbumArtDialog(QDialog):
     """Dialog for retrying failed album art downloads with MusicBrainz IDs."""
-    
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle('Retry Failed Album Art Downloads')
         self.setGeometry(200, 200, 900, 600)
         self.log_data = None
         self.log_file = DEFAULT_LOG_FILE
+        self._failed_albums = []
         self.init_ui()
         self.load_failed_albums()
     
@@ -811,24 +1047,28 @@ class RetryAlbumArtDialog(QDialog):
         table_group = QGroupBox('Failed Albums')
         table_layout = QVBoxLayout()
         
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(['Artist', 'Album', 'MusicBrainz ID', 'Last Attempted', 'Actions'])
+        self.model = FailedAlbumsModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         table_layout.addWidget(self.table)
-        
+
         table_group.setLayout(table_layout)
         layout.addWidget(table_group)
-        
+
         # Buttons
         buttons_layout = QHBoxLayout()
-        
+
         search_btn = QPushButton('Search Selected')
         search_btn.clicked.connect(self.search_selected_album)
         buttons_layout.addWidget(search_btn)
+
+        edit_id_btn = QPushButton('Edit ID')
+        edit_id_btn.clicked.connect(self.edit_mb_id)
+        buttons_layout.addWidget(edit_id_btn)
         
         batch_search_btn = QPushButton('Batch Search All')
         batch_search_btn.clicked.connect(self.batch_search_all)
@@ -852,108 +1092,81 @@ class RetryAlbumArtDialog(QDialog):
     
     def load_failed_albums(self):
         """Load and display failed albums."""
-        # Load log data
+        # Load log data through load_log so it parses with orjson when available
         if self.log_file.exists():
-            try:
-                with open(self.log_file, 'r', encoding='utf-8') as f:
-                    self.log_data = json.load(f)
-            except Exception as e:
-                QMessageBox.warning(self, 'Error', f'Could not load log file: {e}')
-                self.log_data = {'processed_files': {}, 'album_art': {}}
+            self.log_data = audio_repair.load_log(self.log_file)
         else:
             self.log_data = {'processed_files': {}, 'album_art': {}}
             QMessageBox.information(self, 'No Log File', 'No log file found.')
             return
         
-        failed_albums = audio_repair.get_failed_albums(self.log_data)
-        
-        self.table.setRowCount(len(failed_albums))
-        
-        for row, album in enumerate(failed_albums):
-            # Artist
-            self.table.setItem(row, 0, QTableWidgetItem(album['artist']))
-            
-            # Album
-            self.table.setItem(row, 1, QTableWidgetItem(album['album']))
-            
-            # MusicBrainz ID
-            mb_id_item = QTableWidgetItem(album['musicbrainz_id'] or 'Not found')
-            if not album['musicbrainz_id']:
-                mb_id_item.setForeground(Qt.red)
-            self.table.setItem(row, 2, mb_id_item)
-            
-            # Last attempted
-            last_attempted = album['last_attempted']
-            if last_attempted:
-                try:
-                    dt = datetime.fromisoformat(last_attempted)
-                    last_attempted = dt.strftime('%Y-%m-%d %H:%M:%S')
-                except:
-                    pass
-            self.table.setItem(row, 3, QTableWidgetItem(last_attempted or 'Unknown'))
-            
-            # Actions button
-            action_btn = QPushButton('Edit ID')
-            action_btn.clicked.connect(lambda checked, r=row: self.edit_mb_id(r))
-            self.table.setCellWidget(row, 4, action_btn)
-    
-    def edit_mb_id(self, row):
-        """Edit MusicBrainz ID for a specific album."""
-        artist = self.table.item(row, 0).text()
-        album = self.table.item(row, 1).text()
-        current_id = self.table.item(row, 2).text()
-        
-        if current_id == 'Not found':
-            current_id = ''
-        
+        # Memoized for batch_search_all, which otherwise rescans the whole
+        # album_art dict for the same answer
+        self._failed_albums = audio_repair.get_failed_albums(self.log_data)
+        failed_albums = self._failed_albums
+
+        # last_attempted arrives pre-formatted from get_failed_albums
+        self.model.reset_rows([
+            {
+                'artist': album.artist,
+                'album': album.album,
+                'musicbrainz_id': album.musicbrainz_id or '',
+                'last_attempted': album.last_attempted or '',
+                'state': '',
+            }
+            for album in failed_albums
+        ])
+
+    def edit_mb_id(self):
+        """Edit MusicBrainz ID for the selected album."""
+        current_row = self.table.currentIndex().row()
+        if current_row < 0:
+            QMessageBox.information(self, 'No Selection', 'Please select an album from the table.')
+            return
+
+        album = self.model.album_at(current_row)
+
         mb_id, ok = QInputDialog.getText(
             self,
             'Edit MusicBrainz ID',
-            f'Enter MusicBrainz Release Group ID for:\n{artist} - {album}',
-            text=current_id
+            f"Enter MusicBrainz Release Group ID for:\n{album['artist']} - {album['album']}",
+            text=album['musicbrainz_id']
         )
-        
+
         if ok and mb_id.strip():
-            self.table.item(row, 2).setText(mb_id.strip())
-            if mb_id.strip():
-                self.table.item(row, 2).setForeground(Qt.black)
-    
+            self.model.set_mb_id(current_row, mb_id.strip())
+
     def search_selected_album(self):
         """Search for MusicBrainz ID for selected album."""
-        current_row = self.table.currentRow()
+        current_row = self.table.currentIndex().row()
         if current_row < 0:
             QMessageBox.information(self, 'No Selection', 'Please select an album from the table.')
             return
-        
-        artist = self.table.item(current_row, 0).text()
-        album = self.table.item(current_row, 1).text()
-        
+
+        album = self.model.album_at(current_row)
+        artist = album['artist']
+        album_name = album['album']
+
         # Show progress
-        self.table.item(current_row, 2).setText('Searching...')
-        self.table.item(current_row, 2).setForeground(Qt.blue)
+        self.model.set_mb_id(current_row, album['musicbrainz_id'], state='searching')
         QApplication.processEvents()
-        
-        mb_id = audio_repair.search_musicbrainz_release_group(artist, album)
-        
+
+        mb_id = audio_repair.search_musicbrainz_release_group(artist, album_name)
+
+        self.model.set_mb_id(current_row, mb_id or '')
         if mb_id:
-            self.table.item(current_row, 2).setText(mb_id)
-            self.table.item(current_row, 2).setForeground(Qt.black)
             # Update log data
-            album_key = f"{artist}||{album}"
+            album_key = f"{artist}||{album_name}"
             if 'album_art' not in self.log_data:
                 self.log_data['album_art'] = {}
             if album_key not in self.log_data['album_art']:
                 self.log_data['album_art'][album_key] = {}
             self.log_data['album_art'][album_key]['musicbrainz_release_group_id'] = mb_id
             audio_repair.save_log(self.log_data, self.log_file)
-        else:
-            self.table.item(current_row, 2).setText('Not found')
-            self.table.item(current_row, 2).setForeground(Qt.red)
     
     def batch_search_all(self):
         """Batch search for MusicBrainz IDs for all albums without IDs."""
-        failed_albums = audio_repair.get_failed_albums(self.log_data)
-        albums_without_id = [a for a in failed_albums if not a.get('musicbrainz_id')]
+        albums_without_id = [a for a in self._failed_albums if not a.musicbrainz_id]
         
         if not albums_without_id:
             QMessageBox.information(self, 'No Albums', 'All albums already have MusicBrainz IDs.')
@@ -969,21 +1182,20 @@ class RetryAlbumArtDialog(QDialog):
         if reply != QMessageBox.Yes:
             return
         
-        # Update table with progress
+        # Update table with progress; the model maps album_key to its row
+        # directly instead of scanning every row per callback. Event pumping
+        # is throttled to ~30 Hz: each processEvents call repaints the table,
+        # which dominates batch time when results arrive quickly.
+        last_pump = [0.0]
+
         def progress_callback(album_key, mb_id):
-            # Find row and update
-            for row in range(self.table.rowCount()):
-                artist = self.table.item(row, 0).text()
-                album = self.table.item(row, 1).text()
-                if f"{artist}||{album}" == album_key:
-                    if mb_id:
-                        self.table.item(row, 2).setText(mb_id)
-                        self.table.item(row, 2).setForeground(Qt.black)
-                    else:
-                        self.table.item(row, 2).setText('Not found')
-                        self.table.item(row, 2).setForeground(Qt.red)
+            row = self.model.row_for_key(album_key)
+            if row is not None:
+                self.model.set_mb_id(row, mb_id or '')
+                now = time.monotonic()
+                if now - last_pump[0] > 0.033:
                     QApplication.processEvents()
-                    break
+                    last_pump[0] = now
         
         results = audio_repair.batch_search_musicbrainz_ids(albums_without_id, progress_callback)
         
@@ -1007,39 +1219,44 @@ class RetryAlbumArtDialog(QDialog):
     
     def retry_selected(self):
         """Retry downloading art for selected albums."""
-        selected_rows = set()
-        for item in self.table.selectedItems():
-            selected_rows.add(item.row())
-        
+        selected_rows = {index.row() for index in self.table.selectionModel().selectedRows()}
+
         if not selected_rows:
             QMessageBox.information(self, 'No Selection', 'Please select one or more albums to retry.')
             return
-        
+
         retry_count = 0
         success_count = 0
-        
+
         for row in selected_rows:
-            artist = self.table.item(row, 0).text()
-            album = self.table.item(row, 1).text()
-            mb_id = self.table.item(row, 2).text()
-            
-            if not mb_id or mb_id == 'Not found':
-                QMessageBox.warning(self, 'Missing ID', f'Please provide a MusicBrainz ID for:\n{artist} - {album}')
+            album = self.model.album_at(row)
+            artist = album['artist']
+            album_name = album['album']
+            mb_id = album['musicbrainz_id']
+
+            if not mb_id:
+                QMessageBox.warning(self, 'Missing ID', f'Please provide a MusicBrainz ID for:\n{artist} - {album_name}')
                 continue
-            
+
             retry_count += 1
+            # save=False: rewriting the whole log after every album makes a
+            # large retry pass O(N^2) in bytes written; one save below covers
+            # the batch and save_log is atomic either way
             success, art_data = audio_repair.retry_album_art_with_id(
-                artist, album, mb_id, self.log_data, self.log_file
+                artist, album_name, mb_id, self.log_data, self.log_file, save=False
             )
-            
+
             if success:
                 success_count += 1
                 # Update the row to show success
-                self.table.item(row, 2).setForeground(Qt.green)
+                self.model.set_mb_id(row, mb_id, state='success')
                 # Embed art in files if we have them
                 # Note: This would require finding the files, which we don't track here
                 # For now, just mark as successful
-        
+
+        if retry_count:
+            audio_repair.save_log(self.log_data, self.log_file)
+
         # Reload the list to reflect changes
         self.load_failed_albums()
         
@@ -1050,9 +1267,57 @@ class RetryAlbumArtDialog(QDialog):
         )
 
 
+class LibrariesModel(QAbstractTableModel):
+    """Two-column nickname/path model backing the library manager view."""
+
+    HEADERS = ['Nickname', 'Path']
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def reset_rows(self, rows):
+        """Replace all (nickname, path) rows in one model reset."""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def library_at(self, row):
+        return self._rows[row]
+
+    def insert_library(self, nickname, path):
+        """Insert one row at its sorted position without rebuilding the table."""
+        row = bisect.bisect_left(self._rows, (nickname, path))
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.insert(row, (nickname, path))
+        self.endInsertRows()
+
+    def remove_library(self, row):
+        """Remove one row without rebuilding the table."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self.endRemoveRows()
+
+
 class LibraryManagerDialog(QDialog):
     """Dialog for managing music libraries."""
-    
+
     def __init__(self, parent=None, libraries=None):
         super().__init__(parent)
         self.setWindowTitle('Manage Music Libraries')
@@ -1083,13 +1348,13 @@ class LibraryManagerDialog(QDialog):
         table_group = QGroupBox('Saved Libraries')
         table_layout = QVBoxLayout()
         
-        self.table = QTableWidget()
-        self.table.setColumnCount(2)
-        self.table.setHorizontalHeaderLabels(['Nickname', 'Path'])
+        self.model = LibrariesModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SingleSelection)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
         table_layout.addWidget(self.table)
         
         table_group.setLayout(table_layout)
@@ -1124,11 +1389,7 @@ class LibraryManagerDialog(QDialog):
     
     def load_libraries_table(self):
         """Load libraries into the table."""
-        self.table.setRowCount(len(self.libraries))
-        
-        for row, (nickname, path) in enumerate(sorted(self.libraries.items())):
-            self.table.setItem(row, 0, QTableWidgetItem(nickname))
-            self.table.setItem(row, 1, QTableWidgetItem(path))
+        self.model.reset_rows(sorted(self.libraries.items()))
     
     def add_library(self):
         """Add a new library."""
@@ -1159,17 +1420,16 @@ class LibraryManagerDialog(QDialog):
         
         if directory:
             self.libraries[nickname] = directory
-            self.load_libraries_table()
-    
+            self.model.insert_library(nickname, directory)
+
     def edit_library(self):
         """Edit selected library."""
-        current_row = self.table.currentRow()
+        current_row = self.table.currentIndex().row()
         if current_row < 0:
             QMessageBox.information(self, 'No Selection', 'Please select a library to edit.')
             return
-        
-        old_nickname = self.table.item(current_row, 0).text()
-        old_path = self.table.item(current_row, 1).text()
+
+        old_nickname, old_path = self.model.library_at(current_row)
         
         # Get new nickname
         nickname, ok1 = QInputDialog.getText(
@@ -1204,17 +1464,17 @@ class LibraryManagerDialog(QDialog):
                     return
             
             self.libraries[nickname] = directory
-            self.load_libraries_table()
-    
+            self.model.remove_library(current_row)
+            self.model.insert_library(nickname, directory)
+
     def delete_library(self):
         """Delete selected library."""
-        current_row = self.table.currentRow()
+        current_row = self.table.currentIndex().row()
         if current_row < 0:
             QMessageBox.information(self, 'No Selection', 'Please select a library to delete.')
             return
-        
-        nickname = self.table.item(current_row, 0).text()
-        path = self.table.item(current_row, 1).text()
+
+        nickname, path = self.model.library_at(current_row)
         
         reply = QMessageBox.question(
             self,
@@ -1225,7 +1485,7 @@ class LibraryManagerDialog(QDialog):
         
         if reply == QMessageBox.Yes:
             del self.libraries[nickname]
-            self.load_libraries_table()
+            self.model.remove_library(current_row)
 
 
 def main():
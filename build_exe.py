@@ -14,7 +14,9 @@ def build_executable():
     args = [
         'app_desktop.py',
         '--name=AudioMetadataRepair',
-        '--onefile',  # Create a single executable file
+        # --onedir: no per-launch self-extraction to temp like --onefile,
+        # so the app starts in a fraction of the time; zip dist/ for release
+        '--onedir',
         '--windowed',  # No console window (Windows only)
         '--icon=NONE',  # Add icon path here if you have one
         '--add-data=README.md;.',  # Include README
@@ -27,7 +29,21 @@ def build_executable():
         '--hidden-import=mutagen.mp3',
         '--hidden-import=mutagen.flac',
         '--hidden-import=requests',
-        '--collect-all=PySide6',
+        # Optional performance backends; harmless warnings if not installed
+        '--hidden-import=lxml.etree',
+        '--hidden-import=lxml._elementpath',
+        '--hidden-import=orjson',
+        # Only the Qt modules the app imports; --collect-all=PySide6 pulled
+        # in WebEngine, 3D, Quick and friends, bloating the bundle
+        '--collect-submodules=PySide6.QtCore',
+        '--collect-submodules=PySide6.QtGui',
+        '--collect-submodules=PySide6.QtWidgets',
+        '--exclude-module=PySide6.QtWebEngineCore',
+        '--exclude-module=PySide6.QtWebEngineWidgets',
+        '--exclude-module=PySide6.Qt3DCore',
+        '--exclude-module=PySide6.Qt3DRender',
+        '--exclude-module=PySide6.QtQml',
+        '--exclude-module=PySide6.QtQuick',
         '--collect-all=mutagen',
         '--noconfirm',  # Overwrite output directory without asking
         '--clean',  # Clean PyInstaller cache
@@ -39,7 +55,7 @@ def build_executable():
     try:
         PyInstaller.__main__.run(args)
         print("\n✓ Build complete!")
-        print(f"Executable location: dist/AudioMetadataRepair.exe")
+        print(f"Executable location: dist/AudioMetadataRepair/AudioMetadataRepair.exe")
     except Exception as e:
         print(f"\n✗ Build failed: {e}")
         sys.exit(1)
@@ -7,6 +7,9 @@ Supports MP3, FLAC, OGG, Opus, and M4A/MP4 formats.
 """
 
 # Standard library imports
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
 
 # Local imports
@@ -17,6 +20,63 @@ LOGS_DIR = Path('logs')
 LOGS_DIR.mkdir(exist_ok=True)
 DEFAULT_LOG_FILE = LOGS_DIR / 'metadata_repair_log.json'
 SUPPORTED_EXTENSIONS = {'.mp3', '.flac', '.ogg', '.opus', '.m4a', '.mp4'}
+MAX_WORKERS = 8  # Album-level worker threads (repair is dominated by network/disk I/O)
+
+
+def process_album(album_entries, target_dir, album_art_cache, log_data, log_file):
+    """
+    Repair one album directory's files serially.
+
+    Files within an album stay on one thread so the per-album art download
+    and the API courtesy delay keep their original semantics; different
+    albums run on separate threads and overlap their I/O.
+
+    Returns:
+        tuple: (counters dict, album_info dict for nfo generation)
+    """
+    counters = {'success': 0, 'fail': 0, 'skipped': 0}
+    album_info = {}
+
+    # Every entry sits under target_dir, so the display path is a plain
+    # string slice rather than a Path.relative_to construction per file
+    prefix_len = len(os.fspath(target_dir).rstrip(os.sep)) + 1
+
+    for entry in sorted(album_entries, key=lambda e: e.path):
+        print(f"Processing: {entry.path[prefix_len:]}")
+        # Skip unchanged files using the stat data the walk already has,
+        # before repair_audio_file would open them at all
+        if audio_repair.is_entry_processed(entry, log_data):
+            print(f"  ⊘ Already processed (skipping)")
+            counters['skipped'] += 1
+            continue
+
+        audio_file = Path(entry.path)
+        result, track_info = audio_repair.repair_audio_file(audio_file, target_dir, album_art_cache, log_data, log_file)
+        if result:
+            counters['success'] += 1
+            print(f"  ✓ Successfully repaired")
+
+            # Track album information for nfo generation. Keyed by the
+            # directory string: one hash lookup via setdefault, and str
+            # hashing is cached where Path hashing re-walks its parts.
+            if track_info:
+                info = album_info.setdefault(track_info.album_dir, {
+                    'metadata': track_info.album_metadata,
+                    'tracks': {}
+                })
+                # Add track information
+                if track_info.track_number and track_info.track_title:
+                    info['tracks'][track_info.track_number] = track_info.track_title
+        else:
+            counters['fail'] += 1
+            print(f"  ✗ Failed to repair")
+
+    # Persist the log once per album bucket instead of after every file;
+    # save_log writes atomically, so a crash costs at most one album's entries
+    if counters['success']:
+        audio_repair.save_log(log_data, log_file)
+
+    return counters, album_info
 
 
 def main():
@@ -37,68 +97,76 @@ def main():
     print(f"Scanning for audio files in: {target_dir.absolute()}")
     print("-" * 60)
     
-    # Find all supported audio files
-    audio_files = []
-    for ext in SUPPORTED_EXTENSIONS:
-        audio_files.extend(target_dir.rglob(f'*{ext}'))
-    
-    if not audio_files:
-        print("No supported audio files found!")
-        return
-    
-    print(f"Found {len(audio_files)} audio file(s)")
-    print("-" * 60)
-    
-    # Repair each file
+    # Repair counters and shared state
     success_count = 0
     fail_count = 0
     skipped_count = 0
-    album_art_cache = {}  # Cache album art per album to avoid duplicate downloads
-    
+    # Cache album art per album to avoid duplicate downloads; LRU-bounded so
+    # image bytes don't accumulate across the whole run
+    album_art_cache = audio_repair.LRUCache(64)
+
     # Track album information for nfo generation
     # Key: album directory path, Value: dict with metadata and tracks
     album_info = {}
-    
-    for audio_file in sorted(audio_files):
-        print(f"Processing: {audio_file.relative_to(target_dir)}")
-        # Check if already processed before calling repair function
-        was_already_processed = audio_repair.is_file_processed(audio_file, log_data)
-        result, metadata = audio_repair.repair_audio_file(audio_file, target_dir, album_art_cache, log_data, log_file)
-        if result:
-            if was_already_processed:
-                skipped_count += 1
-            else:
-                success_count += 1
-                print(f"  ✓ Successfully repaired")
-                
-                # Track album information for nfo generation
-                if metadata:
-                    album_dir = metadata['album_dir']
-                    if album_dir not in album_info:
-                        album_info[album_dir] = {
-                            'metadata': metadata['album_metadata'],
-                            'tracks': {}
-                        }
-                    # Add track information
-                    if metadata.get('track_number') and metadata.get('track_title'):
-                        album_info[album_dir]['tracks'][metadata['track_number']] = metadata['track_title']
-        else:
-            fail_count += 1
-            print(f"  ✗ Failed to repair")
+
+    # Pipeline discovery and processing: an album bucket is submitted to the
+    # pool as soon as the walk moves past its directory, so the first repairs
+    # start while the rest of the tree is still being scanned. A directory
+    # whose files interleave with a subdirectory's may be submitted in more
+    # than one piece; the art-cache locks and result merging make that safe.
+    total_files = 0
+    futures = []
+    current_dir = None
+    current_bucket = []
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for entry in audio_repair.scan_audio_files(target_dir, SUPPORTED_EXTENSIONS):
+            total_files += 1
+            entry_dir = os.path.dirname(entry.path)
+            if entry_dir != current_dir:
+                if current_bucket:
+                    futures.append(executor.submit(
+                        process_album, current_bucket, target_dir, album_art_cache, log_data, log_file))
+                current_dir = entry_dir
+                current_bucket = []
+            current_bucket.append(entry)
+        if current_bucket:
+            futures.append(executor.submit(
+                process_album, current_bucket, target_dir, album_art_cache, log_data, log_file))
+
+        if not futures:
+            print("No supported audio files found!")
+            return
+
+        print(f"Found {total_files} audio file(s)")
+
+        for future in as_completed(futures):
+            counters, info = future.result()
+            success_count += counters['success']
+            fail_count += counters['fail']
+            skipped_count += counters['skipped']
+            for album_dir, data in info.items():
+                merged = album_info.setdefault(album_dir, {'metadata': data['metadata'], 'tracks': {}})
+                merged['tracks'].update(data['tracks'])
     
     # Generate album.nfo files for albums that don't have one
     print("-" * 60)
     print("Generating album.nfo files for albums without one...")
     nfo_generated = 0
-    
+    # One timestamp for the whole batch; the files need not differ by seconds
+    dateadded = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    # Same display-path slice the per-file loop uses, instead of
+    # Path.relative_to per album
+    prefix_len = len(os.fspath(target_dir).rstrip(os.sep)) + 1
+
     for album_dir, info in album_info.items():
-        nfo_path = album_dir / 'album.nfo'
+        nfo_path = Path(album_dir) / 'album.nfo'
         if not nfo_path.exists():
-            if audio_repair.generate_album_nfo(nfo_path, info['metadata'], info['tracks']):
+            if audio_repair.generate_album_nfo(nfo_path, info['metadata'], info['tracks'], dateadded):
                 nfo_generated += 1
-                print(f"  ✓ Generated: {nfo_path.relative_to(target_dir)}")
+                print(f"  ✓ Generated: {os.fspath(nfo_path)[prefix_len:]}")
             else:
-                print(f"  ✗ Failed to generate: {nfo_path.relative_to(target_dir)}")
+                print(f"  ✗ Failed to generate: {os.fspath(nfo_path)[prefix_len:]}")
     
     # Final log save
     audio_repair.save_log(log_data, log_file)
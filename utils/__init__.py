@@ -11,13 +11,30 @@ from .audio_repair import (
     DEFAULT_MIME_TYPE,
     API_TIMEOUT,
     API_RATE_LIMIT_DELAY,
-    
+
+    # File discovery functions
+    scan_audio_files,
+
+    # Rate limiting
+    RateLimiter,
+
+    # Data types
+    TrackInfo,
+    FailedAlbum,
+    LRUCache,
+
+    # Tag reading functions
+    extract_tags,
+
     # Logging functions
     load_log,
     save_log,
+    format_log_timestamp,
     is_file_processed,
+    is_entry_processed,
     mark_file_processed,
     has_album_art_downloaded,
+    should_retry_album_art,
     get_failed_albums,
     retry_album_art_with_id,
     batch_search_musicbrainz_ids,
@@ -56,11 +73,20 @@ __all__ = [
     'DEFAULT_MIME_TYPE',
     'API_TIMEOUT',
     'API_RATE_LIMIT_DELAY',
+    'scan_audio_files',
+    'RateLimiter',
+    'TrackInfo',
+    'FailedAlbum',
+    'LRUCache',
+    'extract_tags',
     'load_log',
     'save_log',
+    'format_log_timestamp',
     'is_file_processed',
+    'is_entry_processed',
     'mark_file_processed',
     'has_album_art_downloaded',
+    'should_retry_album_art',
     'get_failed_albums',
     'retry_album_art_with_id',
     'batch_search_musicbrainz_ids',
@@ -7,18 +7,44 @@ Supports MP3, FLAC, OGG, Opus, and M4A/MP4 formats.
 """
 
 # Standard library imports
+import atexit
 import base64
+import functools
+import hashlib
+import heapq
 import json
+import os
 import re
+import threading
 import time
-import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import quote_plus
 
 # Third-party imports
 import requests
-from mutagen import File as MutagenFile
+
+# Optional fast JSON codec: several times faster than the stdlib on large
+# logs; everything falls back to the stdlib when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional fast XML backend for the album.nfo paths: lxml parses and
+# serializes in C and its Element API matches what this module uses; the
+# stdlib ElementTree is the fallback
+try:
+    from lxml import etree as ET
+    _HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _HAVE_LXML = False
+from mutagen import File as MutagenFile, MutagenError
 from mutagen.flac import FLAC, Picture
 from mutagen.id3 import APIC, ID3, TALB, TCON, TDRC, TIT2, TPE1, TPE2, TRCK
 from mutagen.mp3 import MP3
@@ -30,6 +56,9 @@ COVER_ART_ARCHIVE_URL = "https://coverartarchive.org"
 USER_AGENT = "AudioMetadataRepair/2.0 (https://github.com/bschwebs/AudioMetaDataRepair)"
 API_TIMEOUT = 10
 API_RATE_LIMIT_DELAY = 0.5
+# How long a failed album-art lookup is trusted before an automatic run
+# tries the network again; manual retries ignore this
+ART_NEGATIVE_TTL = 7 * 24 * 3600
 
 # Supported audio file extensions
 SUPPORTED_EXTENSIONS = {'.mp3', '.flac', '.ogg', '.opus', '.m4a', '.mp4'}
@@ -45,80 +74,460 @@ IMAGE_SIGNATURES = {
 # Default MIME type
 DEFAULT_MIME_TYPE = 'image/jpeg'
 
+# Signature prefixes collapsed to their first four bytes (both GIF variants
+# share b'GIF8'), so detection is one dict lookup instead of a scan
+_MIME_BY_MAGIC = {sig[:4]: mime for sig, mime in IMAGE_SIGNATURES.items()}
+
+# Filename patterns, compiled once: "Artist - Album - TrackNumber - Title"
+# and the "Artist - Title" fallback
+_FILENAME_FULL_RE = re.compile(r'^(.+?)\s*-\s*(.+?)\s*-\s*(\d+)\s*-\s*(.+)$')
+_FILENAME_SIMPLE_RE = re.compile(r'^(.+?)\s*-\s*(.+)$')
+
+# Translation table deleting characters that are invalid in Windows/Linux
+# filenames; one translate() pass replaces a chain of str.replace calls
+_INVALID_FILENAME_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+
+# Shared HTTP session: keeps connections to MusicBrainz and the Cover Art
+# Archive alive across calls instead of paying a TCP/TLS handshake each time.
+# Transient server errors and 429s are retried with backoff at the transport
+# layer, so callers keep their plain success/None handling.
+_SESSION = requests.Session()
+_SESSION.headers.update({'User-Agent': USER_AGENT})
+_SESSION.mount('https://', requests.adapters.HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=requests.adapters.Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 502, 503, 504),
+    ),
+))
+atexit.register(_SESSION.close)
+
+# Release-group search URL with the fixed query parameters baked in; per
+# call only the Lucene query itself needs escaping and appending
+_MB_SEARCH_URL = f"{MUSICBRAINZ_API_URL}/release-group?fmt=json&limit=1&query="
+
+# On-disk album art cache, shared across runs: repeat runs read covers
+# from here instead of re-downloading them
+_ART_CACHE_DIR = Path.home() / '.cache' / 'audiometarepair' / 'art'
+
+
+# ============================================================================
+# Data Types
+# ============================================================================
+
+@dataclass(slots=True)
+class TrackInfo:
+    """
+    Per-file repair result used to accumulate album.nfo information.
+
+    A slotted dataclass instead of a nested dict: one of these is built for
+    every successfully repaired file, and slots avoid the per-instance dict
+    while making the fields explicit.
+    """
+    album_dir: str
+    album_metadata: Dict
+    track_number: Optional[int]
+    track_title: str
+
+
+@dataclass(slots=True, frozen=True)
+class FailedAlbum:
+    """One album whose art download failed, as recorded in the log."""
+    artist: str
+    album: str
+    musicbrainz_id: str
+    last_attempted: str
+
+
+class LRUCache(OrderedDict):
+    """
+    Size-bounded dict that evicts the least recently used entry.
+
+    Drop-in replacement for the plain album-art cache dict: once capacity is
+    exceeded, the oldest entry is discarded, so cached image bytes stay
+    bounded no matter how many albums a run touches. Lookups, inserts, and
+    pops take an internal lock, so album workers sharing one cache can't
+    interleave a read with another worker's eviction; callers should use a
+    single get() rather than a membership check followed by indexing, which
+    an eviction can invalidate in between.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        super().__init__()
+
+    def __getitem__(self, key):
+        with self._lock:
+            value = super().__getitem__(key)
+            self.move_to_end(key)
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            if len(self) > self.capacity:
+                self.popitem(last=False)
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = super().__getitem__(key)
+            except KeyError:
+                return default
+            self.move_to_end(key)
+            return value
+
+    def pop(self, key, *args):
+        with self._lock:
+            return super().pop(key, *args)
+
+
+# ============================================================================
+# File Discovery Functions
+# ============================================================================
+
+def scan_audio_files(
+    root: Path,
+    extensions: Optional[Set[str]] = None,
+    name_predicate: Optional[Callable[[str], bool]] = None
+) -> Iterator[os.DirEntry]:
+    """
+    Recursively scan a directory for supported audio files in a single pass.
+
+    Uses os.scandir() instead of one Path.rglob() call per extension, so the
+    directory tree is walked once and the file-type check reuses information
+    already returned by the directory read (no extra stat() per entry).
+
+    Args:
+        root: Directory to scan
+        extensions: Set of lowercased extensions to match (defaults to SUPPORTED_EXTENSIONS)
+        name_predicate: Optional filename filter applied during the walk, so
+            callers that only handle certain names never see the other entries
+
+    Yields:
+        os.DirEntry objects for matching audio files
+    """
+    if extensions is None:
+        extensions = SUPPORTED_EXTENSIONS
+
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from scan_audio_files(entry.path, extensions, name_predicate)
+                    elif os.path.splitext(entry.name)[1].lower() in extensions:
+                        if name_predicate is None or name_predicate(entry.name):
+                            yield entry
+                except OSError:
+                    continue
+    except (PermissionError, FileNotFoundError):
+        return
+
+
+# ============================================================================
+# Tag Reading Functions
+# ============================================================================
+
+def extract_tags(file_path: Path) -> Dict:
+    """
+    Read artist/album/title/tracknumber from a file's tags in one parse.
+
+    Uses mutagen's easy interface so the same four keys cover MP3, FLAC,
+    OGG/Opus, and MP4 without per-format tag-name branching, and the file
+    header is read exactly once.
+
+    Args:
+        file_path: Path to the audio file
+
+    Returns:
+        Dictionary with any of 'artist', 'album', 'title', 'tracknumber' found
+    """
+    metadata = {}
+    try:
+        audio_file = MutagenFile(str(file_path), easy=True)
+    except (MutagenError, OSError, ValueError):
+        return metadata
+
+    if audio_file is None or not audio_file.tags:
+        return metadata
+
+    def first(key: str) -> str:
+        values = audio_file.tags.get(key)
+        return values[0] if values else ''
+
+    artist = first('artist') or first('albumartist')
+    if artist:
+        metadata['artist'] = artist
+
+    album = first('album')
+    if album:
+        metadata['album'] = album
+
+    title = first('title')
+    if title:
+        metadata['title'] = title
+
+    track = first('tracknumber')
+    if track:
+        try:
+            metadata['tracknumber'] = int(str(track).split('/')[0])
+        except ValueError:
+            metadata['tracknumber'] = 0
+
+    return metadata
+
 
 # ============================================================================
 # Logging Functions
 # ============================================================================
 
+# Parsed-log cache keyed by (path, mtime_ns, size): repeated loads of an
+# unchanged file (each dialog open re-reads the log) skip the JSON decode.
+# save_log drops the entry so the next load re-reads what was written.
+# The cached dict is never handed out directly — every caller gets its own
+# copy, so a processing run mutating its log_data can't corrupt a report
+# or retry dialog iterating over another load of the same file.
+_log_cache_lock = threading.Lock()
+_LOG_CACHE = {'key': None, 'data': None}
+
+
+def _copy_log_data(log_data: Dict) -> Dict:
+    """
+    Copy a parsed log deep enough to decouple it from the cached original.
+
+    The log is two tables of flat per-file/per-album entry dicts holding
+    scalars, so copying down to the entries is a full decouple at a
+    fraction of the cost of copy.deepcopy.
+    """
+    return {
+        table: {key: dict(entry) for key, entry in entries.items()}
+        if isinstance(entries, dict) else entries
+        for table, entries in log_data.items()
+    }
+
+
 def load_log(log_file: Path) -> Dict:
     """
     Load the processing log from JSON file.
 
+    Repeat loads of an unchanged file skip the JSON decode; the cache is
+    invalidated whenever the file's mtime or size changes or save_log runs.
+    Each call returns a fresh copy, so concurrent consumers (a processing
+    run and an open dialog) never share one mutable dict.
+
     Args:
         log_file: Path to the log file
 
     Returns:
         Dictionary containing log data with 'processed_files' and 'album_art' keys
     """
-    if not log_file.exists():
+    try:
+        st = log_file.stat()
+    except OSError:
         return {'processed_files': {}, 'album_art': {}}
-    
+
+    key = (os.fspath(log_file), st.st_mtime_ns, st.st_size)
+    with _log_cache_lock:
+        if _LOG_CACHE['key'] == key:
+            return _copy_log_data(_LOG_CACHE['data'])
+
     try:
-        with open(log_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError) as e:
+        with open(log_file, 'rb') as f:
+            data = f.read()
+        log_data = orjson.loads(data) if orjson is not None else json.loads(data)
+    except (ValueError, IOError) as e:
         print(f"Warning: Could not load log file: {e}")
         print("Starting with empty log.")
         return {'processed_files': {}, 'album_art': {}}
 
+    with _log_cache_lock:
+        _LOG_CACHE['key'] = key
+        _LOG_CACHE['data'] = log_data
+    # The cached parse stays pristine; the caller mutates its own copy
+    return _copy_log_data(log_data)
+
+
+# Guards log_data mutation as well as serialization: workers recording
+# results and a worker dumping the dict at album end take the same lock,
+# so the JSON encoder never iterates a dict another thread is growing
+_save_log_lock = threading.Lock()
+
+# Striped locks for album_art_cache population: concurrent album workers that
+# race on the same artist/album key serialize instead of downloading twice
+_ART_CACHE_LOCKS = [threading.Lock() for _ in range(16)]
+
+
+def _art_cache_lock(album_key: str) -> threading.Lock:
+    """Return the lock stripe guarding cache population for this album key."""
+    return _ART_CACHE_LOCKS[hash(album_key) % len(_ART_CACHE_LOCKS)]
+
+
+# get() default distinguishing a cache miss from a memoized negative
+# result, which is stored as None
+_ART_CACHE_MISS = object()
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter enforcing a minimum interval between acquisitions.
+
+    Unlike a fixed sleep after each request, acquire() only blocks when the
+    next call would actually exceed the allowed rate, so tag writes and other
+    local work proceed during the enforced API cooldown.
+    """
+
+    def __init__(self, rate_per_sec: float):
+        self._interval = 1.0 / rate_per_sec
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> None:
+        """Block until the next request slot is available."""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            if wait > 0:
+                time.sleep(wait)
+                now = time.monotonic()
+            self._next_slot = max(self._next_slot, now) + self._interval
+
+
+# Paces MusicBrainz/Cover Art Archive calls across all worker threads
+_api_rate_limiter = RateLimiter(1.0 / API_RATE_LIMIT_DELAY)
+
 
 def save_log(log_data: Dict, log_file: Path) -> None:
     """
     Save the processing log to JSON file.
 
+    Thread-safe: concurrent callers are serialized, and the mutators
+    (mark_file_processed, mark_album_art_downloaded) take the same lock,
+    so the dump always sees a stable dict even while other album workers
+    keep recording results. The file is written to a temp sibling and
+    swapped in with os.replace, so an interrupted run never leaves a
+    truncated log behind.
+
     Args:
         log_data: Dictionary containing log data
         log_file: Path to the log file
     """
     try:
-        with open(log_file, 'w', encoding='utf-8') as f:
-            json.dump(log_data, f, indent=2, ensure_ascii=False)
-    except IOError as e:
+        with _save_log_lock:
+            if orjson is not None:
+                payload = orjson.dumps(log_data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(log_data, indent=2, ensure_ascii=False).encode('utf-8')
+            tmp_file = log_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_file, log_file)
+        # The file on disk changed; force the next load to re-read it
+        with _log_cache_lock:
+            _LOG_CACHE['key'] = None
+            _LOG_CACHE['data'] = None
+    except (IOError, OSError) as e:
         print(f"Warning: Could not save log file: {e}")
 
 
-def is_file_processed(file_path: Path, log_data: Dict) -> bool:
+def format_log_timestamp(value) -> str:
+    """
+    Render a log timestamp for display.
+
+    New log entries store epoch seconds; entries written by older versions
+    hold isoformat strings. Both come out as 'YYYY-MM-DD HH:MM:SS', and
+    anything unparseable ('', 'Unknown') passes through unchanged.
+
+    Args:
+        value: Epoch number, isoformat string, or placeholder text
+
+    Returns:
+        Human-readable timestamp string
+    """
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value).strftime('%Y-%m-%d %H:%M:%S')
+    if value:
+        try:
+            return datetime.fromisoformat(value).strftime('%Y-%m-%d %H:%M:%S')
+        except (TypeError, ValueError):
+            pass
+    return value
+
+
+def _timestamp_sort_key(value) -> float:
+    """Epoch-seconds sort key for a log timestamp; legacy strings are parsed, junk sorts first."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def is_file_processed(file_path: Path, log_data: Dict, st: Optional[os.stat_result] = None) -> bool:
     """
     Check if a file has already been processed and hasn't been modified since.
 
     Args:
         file_path: Path to the file to check
         log_data: Dictionary containing log data
+        st: Optional stat result the caller already has; when omitted a
+            single os.stat covers both the existence and the mtime check
 
     Returns:
         True if file was processed and hasn't been modified, False otherwise
     """
-    file_str = str(file_path)
-    processed_files = log_data.get('processed_files', {})
-    
-    if file_str not in processed_files:
-        return False
-    
-    if not file_path.exists():
+    file_info = log_data.get('processed_files', {}).get(str(file_path))
+    if file_info is None:
         return False
-    
+
     try:
-        file_info = processed_files[file_str]
-        current_mtime = file_path.stat().st_mtime
-        logged_mtime = file_info.get('file_mtime', 0)
-        
+        if st is None:
+            # One stat replaces the separate exists() + stat() pair; a
+            # missing file surfaces as FileNotFoundError below
+            st = os.stat(file_path)
+
         # File needs reprocessing if it was modified after last processing
-        return current_mtime <= logged_mtime
+        return st.st_mtime <= file_info.get('file_mtime', 0)
     except OSError:
         return False
 
 
-def mark_file_processed(file_path: Path, log_data: Dict, has_art: bool = False) -> None:
+def is_entry_processed(entry: os.DirEntry, log_data: Dict) -> bool:
+    """
+    Check whether a scandir entry was already processed and is unchanged.
+
+    Equivalent to is_file_processed, but reads the mtime from the DirEntry's
+    stat result, which the traversal has usually already cached, instead of
+    issuing a fresh stat() syscall per file.
+
+    Args:
+        entry: Directory entry from scan_audio_files
+        log_data: Dictionary containing log data
+
+    Returns:
+        True if the entry was processed and hasn't been modified, False otherwise
+    """
+    file_info = log_data.get('processed_files', {}).get(entry.path)
+    if file_info is None:
+        return False
+
+    try:
+        return entry.stat().st_mtime <= file_info.get('file_mtime', 0)
+    except OSError:
+        return False
+
+
+def mark_file_processed(
+    file_path: Path,
+    log_data: Dict,
+    has_art: bool = False,
+    st: Optional[os.stat_result] = None
+) -> None:
     """
     Mark a file as processed in the log.
 
@@ -126,22 +535,28 @@ def mark_file_processed(file_path: Path, log_data: Dict, has_art: bool = False)
         file_path: Path to the processed file
         log_data: Dictionary containing log data
         has_art: Whether the file has album art embedded
+        st: Optional stat result taken after the last write to the file;
+            callers that did not modify the file can reuse an earlier stat
     """
     file_str = str(file_path)
-    
+
     try:
-        mtime = file_path.stat().st_mtime
+        mtime = st.st_mtime if st is not None else file_path.stat().st_mtime
     except OSError:
         mtime = 0
-    
-    if 'processed_files' not in log_data:
-        log_data['processed_files'] = {}
-    
-    log_data['processed_files'][file_str] = {
-        'last_processed': datetime.now().isoformat(),
-        'file_mtime': mtime,
-        'has_art': has_art
-    }
+
+    # Same lock as save_log: an insert must not land mid-serialization
+    with _save_log_lock:
+        if 'processed_files' not in log_data:
+            log_data['processed_files'] = {}
+
+        log_data['processed_files'][file_str] = {
+            # Epoch seconds: cheaper to build and serialize than an isoformat
+            # string; format_log_timestamp renders it where shown
+            'last_processed': int(time.time()),
+            'file_mtime': mtime,
+            'has_art': has_art
+        }
 
 
 def has_album_art_downloaded(artist: str, album: str, log_data: Dict) -> bool:
@@ -165,7 +580,33 @@ def has_album_art_downloaded(artist: str, album: str, log_data: Dict) -> bool:
     return album_art_data[album_key].get('downloaded', False)
 
 
-def get_failed_albums(log_data: Dict) -> List[Dict[str, str]]:
+def should_retry_album_art(artist: str, album: str, log_data: Dict) -> bool:
+    """
+    Whether an automatic run should attempt an album art download.
+
+    A previous failure is trusted for ART_NEGATIVE_TTL seconds, so reruns
+    over a large library don't re-pay the rate-limited network round trip
+    for every album that is simply not on MusicBrainz. Albums never
+    attempted, or whose last attempt succeeded, always return True.
+
+    Args:
+        artist: Artist name
+        album: Album name
+        log_data: Dictionary containing log data
+
+    Returns:
+        True if a download attempt is worthwhile, False if a recent
+        attempt already failed
+    """
+    art_info = log_data.get('album_art', {}).get(f"{artist}||{album}")
+    if art_info is None or art_info.get('downloaded', False):
+        return True
+
+    last_attempt = _timestamp_sort_key(art_info.get('last_downloaded', 0))
+    return time.time() - last_attempt >= ART_NEGATIVE_TTL
+
+
+def get_failed_albums(log_data: Dict) -> List[FailedAlbum]:
     """
     Get list of albums that failed to download art.
 
@@ -173,21 +614,24 @@ def get_failed_albums(log_data: Dict) -> List[Dict[str, str]]:
         log_data: Dictionary containing log data
 
     Returns:
-        List of dictionaries with artist, album, musicbrainz_id, and last_attempted keys
+        List of FailedAlbum records
     """
     failed_albums = []
     album_art_data = log_data.get('album_art', {})
-    
+
     for album_key, art_info in album_art_data.items():
         if not art_info.get('downloaded', False):
             artist, album = album_key.split('||', 1)
-            failed_albums.append({
-                'artist': artist,
-                'album': album,
-                'musicbrainz_id': art_info.get('musicbrainz_release_group_id', ''),
-                'last_attempted': art_info.get('last_downloaded', '')
-            })
-    
+            # Format the timestamp for display here, once per record, rather
+            # than in every consumer's row loop
+            last_attempted = format_log_timestamp(art_info.get('last_downloaded', ''))
+            failed_albums.append(FailedAlbum(
+                artist=artist,
+                album=album,
+                musicbrainz_id=art_info.get('musicbrainz_release_group_id', ''),
+                last_attempted=last_attempted
+            ))
+
     return failed_albums
 
 
@@ -196,7 +640,8 @@ def retry_album_art_with_id(
     album: str,
     musicbrainz_id: str,
     log_data: Dict,
-    log_file: Path
+    log_file: Path,
+    save: bool = True
 ) -> Tuple[bool, Optional[bytes]]:
     """
     Retry downloading album art using a specific MusicBrainz release group ID.
@@ -207,6 +652,8 @@ def retry_album_art_with_id(
         musicbrainz_id: MusicBrainz release group ID
         log_data: Dictionary containing log data
         log_file: Path to the log file
+        save: Persist the log immediately; callers retrying a batch of
+            albums pass False and save once at the end
 
     Returns:
         Tuple of (success: bool, image_data: Optional[bytes])
@@ -214,10 +661,11 @@ def retry_album_art_with_id(
     try:
         album_art_data, found_mb_id = get_album_art(artist, album, musicbrainz_id)
         success = album_art_data is not None
-        
+
         # Update log
         mark_album_art_downloaded(artist, album, log_data, success, found_mb_id or musicbrainz_id)
-        save_log(log_data, log_file)
+        if save:
+            save_log(log_data, log_file)
         
         return success, album_art_data
     except Exception as e:
@@ -226,39 +674,53 @@ def retry_album_art_with_id(
 
 
 def batch_search_musicbrainz_ids(
-    failed_albums: List[Dict[str, str]],
+    failed_albums: List[FailedAlbum],
     progress_callback: Optional[Callable[[str, str], None]] = None
 ) -> Dict[str, str]:
     """
     Batch search for MusicBrainz IDs for multiple albums.
 
     Args:
-        failed_albums: List of dictionaries with 'artist' and 'album' keys
+        failed_albums: List of FailedAlbum records to search for
         progress_callback: Optional callback function(album_key, mb_id) for progress updates
 
     Returns:
         Dictionary mapping album_key (artist||album) to MusicBrainz ID or empty string
     """
     results = {}
-    
-    for album_info in failed_albums:
-        artist = album_info.get('artist', '')
-        album = album_info.get('album', '')
-        album_key = f"{artist}||{album}"
-        
-        if not artist or not album:
-            results[album_key] = ''
-            continue
-        
-        mb_id = search_musicbrainz_release_group(artist, album)
-        results[album_key] = mb_id or ''
-        
-        if progress_callback:
-            progress_callback(album_key, mb_id or '')
-        
-        # Respect API rate limits
-        time.sleep(API_RATE_LIMIT_DELAY)
-    
+    pending = {}
+
+    def lookup(artist: str, album: str) -> Optional[str]:
+        # The shared limiter spaces out the actual HTTP calls, so several
+        # in-flight lookups overlap their network time without exceeding
+        # the MusicBrainz rate
+        _api_rate_limiter.acquire()
+        return search_musicbrainz_release_group(artist, album)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for album_info in failed_albums:
+            artist = album_info.artist
+            album = album_info.album
+            album_key = f"{artist}||{album}"
+
+            if not artist or not album:
+                results[album_key] = ''
+                if progress_callback:
+                    progress_callback(album_key, '')
+                continue
+
+            pending[executor.submit(lookup, artist, album)] = album_key
+
+        # Completions are consumed on the calling thread, so the progress
+        # callback runs where the caller expects (the GUI thread)
+        for future in as_completed(pending):
+            album_key = pending[future]
+            mb_id = future.result() or ''
+            results[album_key] = mb_id
+
+            if progress_callback:
+                progress_callback(album_key, mb_id)
+
     return results
 
 
@@ -280,15 +742,17 @@ def mark_album_art_downloaded(
         musicbrainz_id: Optional MusicBrainz release group ID
     """
     album_key = f"{artist}||{album}"
-    
-    if 'album_art' not in log_data:
-        log_data['album_art'] = {}
-    
-    log_data['album_art'][album_key] = {
-        'downloaded': success,
-        'last_downloaded': datetime.now().isoformat(),
-        'musicbrainz_release_group_id': musicbrainz_id or ''
-    }
+
+    # Same lock as save_log: an insert must not land mid-serialization
+    with _save_log_lock:
+        if 'album_art' not in log_data:
+            log_data['album_art'] = {}
+
+        log_data['album_art'][album_key] = {
+            'downloaded': success,
+            'last_downloaded': int(time.time()),
+            'musicbrainz_release_group_id': musicbrainz_id or ''
+        }
 
 
 # ============================================================================
@@ -307,24 +771,17 @@ def search_musicbrainz_release_group(artist: str, album: str) -> Optional[str]:
         Release group ID if found, None otherwise
     """
     try:
-        search_url = f"{MUSICBRAINZ_API_URL}/release-group"
-        params = {
-            'query': f'artist:"{artist}" AND release:"{album}"',
-            'fmt': 'json',
-            'limit': 1
-        }
-        
-        headers = {'User-Agent': USER_AGENT}
-        
-        response = requests.get(
-            search_url,
-            params=params,
-            headers=headers,
+        query = quote_plus(f'artist:"{artist}" AND release:"{album}"')
+
+        response = _SESSION.get(
+            _MB_SEARCH_URL + query,
             timeout=API_TIMEOUT
         )
         response.raise_for_status()
-        data = response.json()
-        
+        # orjson parses the raw body noticeably faster than response.json();
+        # the response carries fields we never look at
+        data = orjson.loads(response.content) if orjson is not None else response.json()
+
         release_groups = data.get('release-groups', [])
         if not release_groups:
             return None
@@ -335,6 +792,41 @@ def search_musicbrainz_release_group(artist: str, album: str) -> Optional[str]:
         return None
 
 
+def _art_cache_path(artist: str, album: str) -> Path:
+    """Disk cache location for an album's cover, keyed by a hash of the album key."""
+    digest = hashlib.sha1(f"{artist}||{album}".encode('utf-8')).hexdigest()
+    return _ART_CACHE_DIR / f"{digest}.bin"
+
+
+def _store_cached_art(cache_path: Path, image_data: bytes) -> None:
+    """Write a cover to the disk cache atomically; cache errors are non-fatal."""
+    try:
+        _ART_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(image_data)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def _download_image(url: str) -> Tuple[int, Optional[bytes]]:
+    """
+    Fetch an image URL in chunks and return (status_code, bytes or None).
+
+    Streaming into a bytearray keeps one copy of the cover in memory at a
+    time; requests' non-streaming path buffers the raw body and then copies
+    it into response.content, doubling the peak per download.
+    """
+    with _SESSION.get(url, timeout=API_TIMEOUT, allow_redirects=True, stream=True) as response:
+        if response.status_code != 200:
+            return response.status_code, None
+
+        buf = bytearray()
+        for chunk in response.iter_content(chunk_size=65536):
+            buf.extend(chunk)
+        return 200, bytes(buf)
+
+
 def get_album_art(
     artist: str,
     album: str,
@@ -351,45 +843,56 @@ def get_album_art(
     Returns:
         Tuple of (image data as bytes, release_group_id) or (None, release_group_id) if not found
     """
+    # Disk cache first: a cover downloaded in any earlier run (or by a
+    # sibling process) is reused without touching the network or the
+    # rate limiter. Failed lookups never populate the cache, so a miss
+    # here falls through to the normal download path.
+    cache_path = _art_cache_path(artist, album)
     try:
+        return cache_path.read_bytes(), musicbrainz_release_group_id
+    except OSError:
+        pass
+
+    try:
+        # Pace API calls here so every caller gets the same rate limiting;
+        # acquire() only blocks when calls actually come faster than allowed
+        _api_rate_limiter.acquire()
+
         # Use provided ID or search for it
         release_group_id = musicbrainz_release_group_id
         if not release_group_id:
             release_group_id = search_musicbrainz_release_group(artist, album)
             if not release_group_id:
                 return None, None
-        
+
         # Try to get cover art from release group
         cover_art_url = f"{COVER_ART_ARCHIVE_URL}/release-group/{release_group_id}/front"
-        headers = {'User-Agent': USER_AGENT}
-        
-        response = requests.get(
-            cover_art_url,
-            headers=headers,
-            timeout=API_TIMEOUT,
-            allow_redirects=True
-        )
-        
-        if response.status_code == 200:
-            return response.content, release_group_id
-        
-        if response.status_code == 404:
+
+        status, image_data = _download_image(cover_art_url)
+
+        if status == 200:
+            _store_cached_art(cache_path, image_data)
+            return image_data, release_group_id
+
+        if status == 404:
             # Fallback: try individual releases
-            return _try_release_art(release_group_id, headers)
-        
+            image_data, release_group_id = _try_release_art(release_group_id)
+            if image_data is not None:
+                _store_cached_art(cache_path, image_data)
+            return image_data, release_group_id
+
         return None, release_group_id
     except Exception as e:
         print(f"  Warning: Could not download album art: {e}")
         return None, None
 
 
-def _try_release_art(release_group_id: str, headers: Dict[str, str]) -> Tuple[Optional[bytes], Optional[str]]:
+def _try_release_art(release_group_id: str) -> Tuple[Optional[bytes], Optional[str]]:
     """
     Try to get album art from individual releases as fallback.
 
     Args:
         release_group_id: MusicBrainz release group ID
-        headers: HTTP headers to use
 
     Returns:
         Tuple of (image data, release_group_id) or (None, release_group_id)
@@ -397,36 +900,30 @@ def _try_release_art(release_group_id: str, headers: Dict[str, str]) -> Tuple[Op
     try:
         releases_url = f"{MUSICBRAINZ_API_URL}/release-group/{release_group_id}"
         params = {'inc': 'releases', 'fmt': 'json'}
-        
-        response = requests.get(
+
+        response = _SESSION.get(
             releases_url,
             params=params,
-            headers=headers,
             timeout=API_TIMEOUT
         )
-        
+
         if response.status_code != 200:
             return None, release_group_id
-        
-        data = response.json()
+
+        data = orjson.loads(response.content) if orjson is not None else response.json()
         releases = data.get('releases', [])
         if not releases:
             return None, release_group_id
-        
+
         # Try first release
         release_id = releases[0]['id']
         cover_art_url = f"{COVER_ART_ARCHIVE_URL}/release/{release_id}/front"
-        
-        response = requests.get(
-            cover_art_url,
-            headers=headers,
-            timeout=API_TIMEOUT,
-            allow_redirects=True
-        )
-        
-        if response.status_code == 200:
-            return response.content, release_group_id
-        
+
+        status, image_data = _download_image(cover_art_url)
+
+        if status == 200:
+            return image_data, release_group_id
+
         return None, release_group_id
     except Exception:
         return None, release_group_id
@@ -442,19 +939,11 @@ def detect_mime_type(image_data: bytes) -> str:
     Returns:
         MIME type string (defaults to 'image/jpeg')
     """
-    # Check PNG signature
-    if image_data[:4] == b'\x89PNG':
-        return 'image/png'
-    
-    # Check GIF signatures
-    if image_data[:6] in (b'GIF87a', b'GIF89a'):
-        return 'image/gif'
-    
-    # Check WebP signature (RIFF header with WEBP in bytes 8-12)
-    if image_data[:4] == b'RIFF' and b'WEBP' in image_data[8:12]:
-        return 'image/webp'
-    
-    return DEFAULT_MIME_TYPE
+    mime = _MIME_BY_MAGIC.get(image_data[:4], DEFAULT_MIME_TYPE)
+    # RIFF is only WebP if the chunk type at bytes 8-12 confirms it
+    if mime == 'image/webp' and image_data[8:12] != b'WEBP':
+        return DEFAULT_MIME_TYPE
+    return mime
 
 
 def embed_album_art_mp3(file_path: Path, image_data: bytes, mime_type: str = DEFAULT_MIME_TYPE):
@@ -649,13 +1138,14 @@ def generate_text_report(log_data: dict) -> str:
     report.append("FAILED OBJECTS")
     report.append("-" * 70)
     
-    # Files without album art
+    # Files without album art; nsmallest keeps only the 50 shown rows
+    # instead of sorting the whole set
     files_without_art = [(path, info) for path, info in processed_files.items() if not info.get('has_art', False)]
     if files_without_art:
         report.append(f"Files Without Album Art: {len(files_without_art)}")
         report.append("")
-        for file_path, file_info in sorted(files_without_art)[:50]:  # Show first 50
-            last_processed = file_info.get('last_processed', 'Unknown')
+        for file_path, file_info in heapq.nsmallest(50, files_without_art, key=lambda x: x[0]):
+            last_processed = format_log_timestamp(file_info.get('last_processed', 'Unknown'))
             report.append(f"  ✗ {file_path}")
             report.append(f"      Last Processed: {last_processed}")
         if len(files_without_art) > 50:
@@ -669,7 +1159,7 @@ def generate_text_report(log_data: dict) -> str:
         for album_key, art_info in sorted(album_art.items()):
             if not art_info.get('downloaded', False):
                 mb_id = art_info.get('musicbrainz_release_group_id', '') or 'Not found'
-                last_downloaded = art_info.get('last_downloaded', 'Unknown')
+                last_downloaded = format_log_timestamp(art_info.get('last_downloaded', 'Unknown'))
                 report.append(f"  ✗ {album_key.replace('||', ' - ')}")
                 report.append(f"      MusicBrainz ID: {mb_id}")
                 report.append(f"      Last Attempted: {last_downloaded}")
@@ -682,15 +1172,15 @@ def generate_text_report(log_data: dict) -> str:
     report.append("RECENT PROCESSING ACTIVITY")
     report.append("-" * 70)
     
-    # Sort files by last processed date
-    sorted_files = sorted(
+    # Most recently processed files; a 20-element heap beats a full sort
+    sorted_files = heapq.nlargest(
+        20,
         processed_files.items(),
-        key=lambda x: x[1].get('last_processed', ''),
-        reverse=True
-    )[:20]  # Show last 20 files
-    
+        key=lambda x: _timestamp_sort_key(x[1].get('last_processed', ''))
+    )
+
     for file_path, file_info in sorted_files:
-        last_processed = file_info.get('last_processed', 'Unknown')
+        last_processed = format_log_timestamp(file_info.get('last_processed', 'Unknown'))
         has_art = '✓' if file_info.get('has_art', False) else '✗'
         report.append(f"{has_art} {file_path}")
         report.append(f"    Last Processed: {last_processed}")
@@ -758,14 +1248,15 @@ def generate_html_report(log_data: dict) -> str:
     html.append("<table>")
     html.append("<tr><th>File</th><th>Last Processed</th><th>Has Art</th></tr>")
     
-    sorted_files = sorted(
+    # Most recently processed files; a 100-element heap beats a full sort
+    sorted_files = heapq.nlargest(
+        100,
         processed_files.items(),
-        key=lambda x: x[1].get('last_processed', ''),
-        reverse=True
-    )[:100]  # Show last 100 files
+        key=lambda x: _timestamp_sort_key(x[1].get('last_processed', ''))
+    )
     
     for file_path, file_info in sorted_files:
-        last_processed = file_info.get('last_processed', 'Unknown')
+        last_processed = format_log_timestamp(file_info.get('last_processed', 'Unknown'))
         has_art = file_info.get('has_art', False)
         art_class = "has-art" if has_art else "no-art"
         art_symbol = "✓" if has_art else "✗"
@@ -776,16 +1267,17 @@ def generate_html_report(log_data: dict) -> str:
     # Failed objects section
     html.append("<h2>Failed Objects</h2>")
     
-    # Files without album art
+    # Files without album art; nsmallest keeps only the 100 shown rows
+    # instead of sorting the whole set
     files_without_art = [(path, info) for path, info in processed_files.items() if not info.get('has_art', False)]
     if files_without_art:
         html.append("<h3>Files Without Album Art</h3>")
         html.append(f"<p>Total: {len(files_without_art)} files</p>")
         html.append("<table>")
         html.append("<tr><th>File</th><th>Last Processed</th></tr>")
-        
-        for file_path, file_info in sorted(files_without_art)[:100]:  # Show first 100
-            last_processed = file_info.get('last_processed', 'Unknown')
+
+        for file_path, file_info in heapq.nsmallest(100, files_without_art, key=lambda x: x[0]):  # Show first 100
+            last_processed = format_log_timestamp(file_info.get('last_processed', 'Unknown'))
             html.append(f"<tr><td>{file_path}</td><td>{last_processed}</td></tr>")
         
         html.append("</table>")
@@ -802,7 +1294,7 @@ def generate_html_report(log_data: dict) -> str:
         
         for album_key, art_info in sorted(failed_albums):
             mb_id = art_info.get('musicbrainz_release_group_id', '') or 'Not found'
-            last_downloaded = art_info.get('last_downloaded', 'Unknown')
+            last_downloaded = format_log_timestamp(art_info.get('last_downloaded', 'Unknown'))
             html.append(f"<tr><td>{album_key.replace('||', ' - ')}</td><td>{mb_id}</td><td>{last_downloaded}</td></tr>")
         
         html.append("</table>")
@@ -820,7 +1312,7 @@ def generate_html_report(log_data: dict) -> str:
         mb_id = art_info.get('musicbrainz_release_group_id', '')
         if not mb_id:
             mb_id = 'Not found'
-        last_downloaded = art_info.get('last_downloaded', 'Unknown')
+        last_downloaded = format_log_timestamp(art_info.get('last_downloaded', 'Unknown'))
         html.append(f"<tr><td>{album_key.replace('||', ' - ')}</td><td class='{status_class}'>{status}</td><td>{mb_id}</td><td>{last_downloaded}</td></tr>")
     
     html.append("</table>")
@@ -851,7 +1343,7 @@ def generate_csv_report(log_data: dict, output_path: Path) -> None:
         for file_path, file_info in sorted(processed_files.items()):
             writer.writerow([
                 file_path,
-                file_info.get('last_processed', ''),
+                format_log_timestamp(file_info.get('last_processed', '')),
                 'Yes' if file_info.get('has_art', False) else 'No',
                 file_info.get('file_mtime', '')
             ])
@@ -868,7 +1360,7 @@ def generate_csv_report(log_data: dict, output_path: Path) -> None:
             for file_path, file_info in sorted(files_without_art):
                 writer.writerow([
                     file_path,
-                    file_info.get('last_processed', ''),
+                    format_log_timestamp(file_info.get('last_processed', '')),
                     file_info.get('file_mtime', '')
                 ])
         
@@ -880,7 +1372,7 @@ def generate_csv_report(log_data: dict, output_path: Path) -> None:
             writer.writerow(['Album', 'MusicBrainz ID', 'Last Attempted'])
             for album_key, art_info in sorted(failed_albums):
                 mb_id = art_info.get('musicbrainz_release_group_id', '') or 'Not found'
-                last_downloaded = art_info.get('last_downloaded', 'Unknown')
+                last_downloaded = format_log_timestamp(art_info.get('last_downloaded', 'Unknown'))
                 writer.writerow([album_key.replace('||', ' - '), mb_id, last_downloaded])
         
         # Write all album art downloads
@@ -891,7 +1383,7 @@ def generate_csv_report(log_data: dict, output_path: Path) -> None:
         for album_key, art_info in sorted(album_art.items()):
             status = "Success" if art_info.get('downloaded', False) else "Failed"
             mb_id = art_info.get('musicbrainz_release_group_id', '') or 'Not found'
-            last_downloaded = art_info.get('last_downloaded', 'Unknown')
+            last_downloaded = format_log_timestamp(art_info.get('last_downloaded', 'Unknown'))
             writer.writerow([album_key.replace('||', ' - '), status, mb_id, last_downloaded])
 
 
@@ -910,7 +1402,7 @@ def parse_album_nfo(nfo_path: Path) -> Optional[Dict]:
         Dictionary containing album metadata and tracks, or None if parsing fails
     """
     try:
-        tree = ET.parse(nfo_path)
+        tree = ET.parse(str(nfo_path))
         root = tree.getroot()
         
         metadata = {
@@ -936,7 +1428,12 @@ def parse_album_nfo(nfo_path: Path) -> Optional[Dict]:
         return None
 
 
-def generate_album_nfo(nfo_path: Path, album_metadata: Dict, tracks: Dict[int, str]) -> bool:
+def generate_album_nfo(
+    nfo_path: Path,
+    album_metadata: Dict,
+    tracks: Dict[int, str],
+    dateadded: Optional[str] = None
+) -> bool:
     """
     Generate an album.nfo file with the provided metadata and track information.
 
@@ -944,6 +1441,8 @@ def generate_album_nfo(nfo_path: Path, album_metadata: Dict, tracks: Dict[int, s
         nfo_path: Path where the album.nfo file should be created
         album_metadata: Dictionary containing album-level metadata
         tracks: Dictionary mapping track numbers to track titles
+        dateadded: Optional preformatted timestamp; batch callers compute
+            it once per run instead of per album
 
     Returns:
         True if successful, False otherwise
@@ -961,8 +1460,8 @@ def generate_album_nfo(nfo_path: Path, album_metadata: Dict, tracks: Dict[int, s
         lockdata.text = 'false'
         
         # Add dateadded
-        dateadded = ET.SubElement(root, 'dateadded')
-        dateadded.text = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        dateadded_elem = ET.SubElement(root, 'dateadded')
+        dateadded_elem.text = dateadded or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
         # Add title (album name)
         title = ET.SubElement(root, 'title')
@@ -1018,12 +1517,14 @@ def generate_album_nfo(nfo_path: Path, album_metadata: Dict, tracks: Dict[int, s
             duration = ET.SubElement(track_elem, 'duration')
             duration.text = ''
         
-        # Create tree and write to file
+        # Create tree and write to file with proper XML declaration
         tree = ET.ElementTree(root)
-        ET.indent(tree, space='  ')  # Pretty print with 2-space indentation
-        
-        # Write to file with proper XML declaration
-        tree.write(nfo_path, encoding='utf-8', xml_declaration=True)
+        if _HAVE_LXML:
+            # lxml indents during serialization; no separate whitespace walk
+            tree.write(str(nfo_path), encoding='utf-8', xml_declaration=True, pretty_print=True)
+        else:
+            ET.indent(tree, space='  ')  # Pretty print with 2-space indentation
+            tree.write(nfo_path, encoding='utf-8', xml_declaration=True)
         return True
     except Exception as e:
         print(f"  Warning: Could not generate album.nfo: {e}")
@@ -1042,13 +1543,13 @@ def parse_filename(filename: str) -> Optional[Dict]:
 
     Expected format: "Artist - Album - TrackNumber - Title.ext"
     """
-    # Remove extension
-    name_without_ext = Path(filename).stem
-    
+    # Remove extension; callers pass bare names that always carry one of
+    # the supported suffixes, so a rsplit avoids a Path object per file
+    name_without_ext = filename.rsplit('.', 1)[0]
+
     # Try to match pattern: Artist - Album - TrackNumber - Title
-    pattern = r'^(.+?)\s*-\s*(.+?)\s*-\s*(\d+)\s*-\s*(.+)$'
-    match = re.match(pattern, name_without_ext)
-    
+    match = _FILENAME_FULL_RE.match(name_without_ext)
+
     if match:
         artist, album, track_num, title = match.groups()
         return {
@@ -1059,8 +1560,7 @@ def parse_filename(filename: str) -> Optional[Dict]:
         }
     
     # Try simpler pattern: Artist - Title
-    pattern2 = r'^(.+?)\s*-\s*(.+)$'
-    match2 = re.match(pattern2, name_without_ext)
+    match2 = _FILENAME_SIMPLE_RE.match(name_without_ext)
     if match2:
         artist, title = match2.groups()
         return {
@@ -1071,17 +1571,17 @@ def parse_filename(filename: str) -> Optional[Dict]:
     return None
 
 
-def fix_filename(file_path: Path, metadata: Dict, album_metadata: Optional[Dict] = None) -> bool:
+def fix_filename(file_path: Path, metadata: Dict, album_metadata: Optional[Dict] = None) -> Optional[Path]:
     """
     Rename a file to match the expected format: "Artist - Album - TrackNumber - Title.ext"
-    
+
     Args:
         file_path: Path to the file to rename
         metadata: Dictionary with track metadata (from filename or tags)
         album_metadata: Optional album-level metadata (from album.nfo)
-    
+
     Returns:
-        True if file was renamed, False otherwise
+        The new Path if the file was renamed, None otherwise
     """
     try:
         # Get metadata from parameters or try to read from file tags
@@ -1096,84 +1596,40 @@ def fix_filename(file_path: Path, metadata: Dict, album_metadata: Optional[Dict]
         if not album and album_metadata:
             album = album_metadata.get('album', '')
         
-        # If still missing, try to read from file tags
+        # If still missing, try to read from file tags. easy=True exposes
+        # the same artist/album/tracknumber/title keys for every supported
+        # format, replacing a per-suffix ladder of format-specific readers.
         if not artist or not album or not track_number or not title:
-            suffix = file_path.suffix.lower()
             try:
-                if suffix == '.mp3':
-                    audio_file = MP3(str(file_path))
-                    if not artist:
-                        artist = audio_file.get('TPE1', [''])[0] or audio_file.get('TPE2', [''])[0]
-                    if not album:
-                        album = audio_file.get('TALB', [''])[0]
-                    if not track_number:
-                        track_num_str = audio_file.get('TRCK', ['0'])[0]
-                        try:
-                            track_number = int(track_num_str.split('/')[0])
-                        except:
-                            track_number = 0
-                    if not title:
-                        title = audio_file.get('TIT2', [''])[0]
-                elif suffix == '.flac':
-                    audio_file = FLAC(str(file_path))
+                audio_file = MutagenFile(str(file_path), easy=True)
+                if audio_file is not None:
                     if not artist:
-                        artist = audio_file.get('ARTIST', [''])[0] or audio_file.get('ALBUMARTIST', [''])[0]
+                        artist = audio_file.get('artist', [''])[0] or audio_file.get('albumartist', [''])[0]
                     if not album:
-                        album = audio_file.get('ALBUM', [''])[0]
+                        album = audio_file.get('album', [''])[0]
                     if not track_number:
-                        track_num_str = audio_file.get('TRACKNUMBER', ['0'])[0]
+                        track_num_str = audio_file.get('tracknumber', ['0'])[0]
                         try:
-                            track_number = int(track_num_str.split('/')[0])
-                        except:
+                            track_number = int(str(track_num_str).split('/')[0])
+                        except (ValueError, IndexError):
                             track_number = 0
                     if not title:
-                        title = audio_file.get('TITLE', [''])[0]
-                elif suffix in ('.ogg', '.opus'):
-                    audio_file = MutagenFile(str(file_path))
-                    if audio_file:
-                        if not artist:
-                            artist = audio_file.get('ARTIST', [''])[0] or audio_file.get('ALBUMARTIST', [''])[0]
-                        if not album:
-                            album = audio_file.get('ALBUM', [''])[0]
-                        if not track_number:
-                            track_num_str = audio_file.get('TRACKNUMBER', ['0'])[0]
-                            try:
-                                track_number = int(track_num_str.split('/')[0])
-                            except:
-                                track_number = 0
-                        if not title:
-                            title = audio_file.get('TITLE', [''])[0]
-                elif suffix in ('.m4a', '.mp4'):
-                    audio_file = MP4(str(file_path))
-                    if not artist:
-                        artist = audio_file.get('\xa9ART', [''])[0] or audio_file.get('aART', [''])[0]
-                    if not album:
-                        album = audio_file.get('\xa9alb', [''])[0]
-                    if not track_number:
-                        track_list = audio_file.get('trkn', [(0, 0)])
-                        if track_list:
-                            track_number = track_list[0][0]
-                    if not title:
-                        title = audio_file.get('\xa9nam', [''])[0]
-            except:
+                        title = audio_file.get('title', [''])[0]
+            except (MutagenError, OSError, ValueError, KeyError):
                 pass
         
         # Check if we have all required fields
         if not artist or not album or not track_number or not title:
-            return False
+            return None
         
         # Format track number with zero padding
         track_str = f"{track_number:02d}"
         
         # Clean up strings (remove invalid filename characters)
         def clean_filename(s: str) -> str:
-            # Remove invalid characters for Windows/Linux
-            invalid_chars = '<>:"/\\|?*'
-            for char in invalid_chars:
-                s = s.replace(char, '')
-            # Replace multiple spaces with single space
-            s = ' '.join(s.split())
-            return s.strip()
+            # Strip invalid characters in one pass, then collapse
+            # whitespace runs to single spaces
+            return ' '.join(s.translate(_INVALID_FILENAME_CHARS).split())
         
         artist = clean_filename(artist)
         album = clean_filename(album)
@@ -1185,25 +1641,57 @@ def fix_filename(file_path: Path, metadata: Dict, album_metadata: Optional[Dict]
         
         # Check if new filename is different
         if new_path == file_path:
-            return False  # Already correct format
-        
+            return None  # Already correct format
+
         # Check if target file already exists
         if new_path.exists():
-            return False  # Would overwrite existing file
-        
+            return None  # Would overwrite existing file
+
         # Rename the file
         file_path.rename(new_path)
-        return True
-        
+        return new_path
+
     except Exception as e:
         print(f"  Error fixing filename: {e}")
-        return False
+        return None
 
 
 # ============================================================================
 # Repair Functions
 # ============================================================================
 
+def _update_id3_text(tags, key: str, frame_cls, text) -> bool:
+    """Set an ID3 text frame, returning True only if the stored value changed."""
+    frame = tags.get(key)
+    if frame is not None and str(frame) == str(text):
+        return False
+    tags[key] = frame_cls(encoding=3, text=str(text))
+    return True
+
+
+def _update_tag(audio_file, key: str, value) -> bool:
+    """Set a list-valued tag (Vorbis comment / MP4), returning True only if it changed."""
+    if audio_file.get(key) == (value if isinstance(value, list) else [value]):
+        return False
+    audio_file[key] = value
+    return True
+
+
+def _resolve_title(metadata: Dict, album_metadata: Optional[Dict]):
+    """
+    The title a repair should end with: album.nfo's canonical track title
+    when the track number is listed there, else the filename-derived one
+    (None when neither applies). Resolved before the compare-and-assign so
+    the dirty flag stays honest — writing the filename title first and
+    overriding it from the nfo after would flip an already-correct tag
+    away and back, marking the file changed on every run.
+    """
+    title = metadata.get('title')
+    if album_metadata and 'tracknumber' in metadata:
+        title = album_metadata.get('tracks', {}).get(metadata['tracknumber'], title)
+    return title
+
+
 def repair_mp3_metadata(
     file_path: Path,
     metadata: Dict,
@@ -1224,50 +1712,68 @@ def repair_mp3_metadata(
     """
     try:
         audio_file = MP3(str(file_path), ID3=ID3)
-        
+
+        # Only save when a tag actually changes; on a mostly-correct
+        # library this skips the expensive rewrite (and the mtime bump)
+        # for files that are already right
+        changed = False
+
         # Create ID3 tag if it doesn't exist
         if audio_file.tags is None:
             audio_file.add_tags()
-        
-        # Set metadata from parsed filename
-        if 'title' in metadata:
-            audio_file.tags['TIT2'] = TIT2(encoding=3, text=metadata['title'])
-        
+            changed = True
+
+        tags = audio_file.tags
+
+        # Set metadata from parsed filename (title resolved against the
+        # nfo's canonical track list first)
+        title = _resolve_title(metadata, album_metadata)
+        if title is not None:
+            changed |= _update_id3_text(tags, 'TIT2', TIT2, title)
+
         if 'artist' in metadata:
-            audio_file.tags['TPE1'] = TPE1(encoding=3, text=metadata['artist'])
-        
+            changed |= _update_id3_text(tags, 'TPE1', TPE1, metadata['artist'])
+
         if 'album' in metadata:
-            audio_file.tags['TALB'] = TALB(encoding=3, text=metadata['album'])
-        
+            changed |= _update_id3_text(tags, 'TALB', TALB, metadata['album'])
+
         if 'tracknumber' in metadata:
-            audio_file.tags['TRCK'] = TRCK(encoding=3, text=str(metadata['tracknumber']))
-        
+            changed |= _update_id3_text(tags, 'TRCK', TRCK, metadata['tracknumber'])
+
         # Use album.nfo metadata if available
         if album_metadata:
             if album_metadata.get('album') and not metadata.get('album'):
-                audio_file.tags['TALB'] = TALB(encoding=3, text=album_metadata['album'])
-            
+                changed |= _update_id3_text(tags, 'TALB', TALB, album_metadata['album'])
+
             if album_metadata.get('albumartist'):
-                audio_file.tags['TPE2'] = TPE2(encoding=3, text=album_metadata['albumartist'])
-            
+                changed |= _update_id3_text(tags, 'TPE2', TPE2, album_metadata['albumartist'])
+
             if album_metadata.get('year'):
-                audio_file.tags['TDRC'] = TDRC(encoding=3, text=album_metadata['year'])
-            
+                changed |= _update_id3_text(tags, 'TDRC', TDRC, album_metadata['year'])
+
             if album_metadata.get('genre'):
-                audio_file.tags['TCON'] = TCON(encoding=3, text=album_metadata['genre'])
-            
-            # Update track title from album.nfo if available
-            if 'tracknumber' in metadata:
-                track_num = metadata['tracknumber']
-                if track_num in album_metadata.get('tracks', {}):
-                    audio_file.tags['TIT2'] = TIT2(encoding=3, text=album_metadata['tracks'][track_num])
-        
-        # Embed album art if provided
+                changed |= _update_id3_text(tags, 'TCON', TCON, album_metadata['genre'])
+
+        # Embed album art on the already-open tag object; going through
+        # embed_album_art_mp3 would re-open and re-save the file
         if album_art:
-            mime_type = detect_mime_type(album_art)
-            embed_album_art_mp3(file_path, album_art, mime_type)
-        
-        audio_file.save()
+            existing = tags.getall('APIC')
+            if not (existing and bytes(existing[0].data) == album_art):
+                if 'APIC:' in tags:
+                    del tags['APIC:']
+                tags.add(
+                    APIC(
+                        encoding=3,
+                        mime=detect_mime_type(album_art),
+                        type=3,
+                        desc='Cover',
+                        data=album_art
+                    )
+                )
+                changed = True
+
+        if changed:
+            audio_file.save()
         return True
     except Exception as e:
         print(f"Error repairing {file_path}: {e}")
@@ -1294,46 +1800,54 @@ def repair_flac_metadata(
     """
     try:
         audio_file = FLAC(str(file_path))
-        
-        # Set metadata from parsed filename
-        if 'title' in metadata:
-            audio_file['TITLE'] = metadata['title']
-        
+
+        # Only save when a tag actually changes (see repair_mp3_metadata)
+        changed = False
+
+        # Set metadata from parsed filename (title resolved against the
+        # nfo's canonical track list first)
+        title = _resolve_title(metadata, album_metadata)
+        if title is not None:
+            changed |= _update_tag(audio_file, 'TITLE', title)
+
         if 'artist' in metadata:
-            audio_file['ARTIST'] = metadata['artist']
-        
+            changed |= _update_tag(audio_file, 'ARTIST', metadata['artist'])
+
         if 'album' in metadata:
-            audio_file['ALBUM'] = metadata['album']
-        
+            changed |= _update_tag(audio_file, 'ALBUM', metadata['album'])
+
         if 'tracknumber' in metadata:
-            audio_file['TRACKNUMBER'] = str(metadata['tracknumber'])
-        
+            changed |= _update_tag(audio_file, 'TRACKNUMBER', str(metadata['tracknumber']))
+
         # Use album.nfo metadata if available
         if album_metadata:
             if album_metadata.get('album') and not metadata.get('album'):
-                audio_file['ALBUM'] = album_metadata['album']
-            
+                changed |= _update_tag(audio_file, 'ALBUM', album_metadata['album'])
+
             if album_metadata.get('albumartist'):
-                audio_file['ALBUMARTIST'] = album_metadata['albumartist']
-            
+                changed |= _update_tag(audio_file, 'ALBUMARTIST', album_metadata['albumartist'])
+
             if album_metadata.get('year'):
-                audio_file['DATE'] = album_metadata['year']
-            
+                changed |= _update_tag(audio_file, 'DATE', album_metadata['year'])
+
             if album_metadata.get('genre'):
-                audio_file['GENRE'] = album_metadata['genre']
-            
-            # Update track title from album.nfo if available
-            if 'tracknumber' in metadata:
-                track_num = metadata['tracknumber']
-                if track_num in album_metadata.get('tracks', {}):
-                    audio_file['TITLE'] = album_metadata['tracks'][track_num]
-        
-        # Embed album art if provided
+                changed |= _update_tag(audio_file, 'GENRE', album_metadata['genre'])
+
+        # Embed album art on the already-open file; going through
+        # embed_album_art_flac would re-open and re-save it
         if album_art:
-            mime_type = detect_mime_type(album_art)
-            embed_album_art_flac(file_path, album_art, mime_type)
-        
-        audio_file.save()
+            pictures = audio_file.pictures
+            if not (len(pictures) == 1 and pictures[0].data == album_art):
+                audio_file.clear_pictures()
+                picture = Picture()
+                picture.type = 3  # Cover front
+                picture.mime = detect_mime_type(album_art)
+                picture.data = album_art
+                audio_file.add_picture(picture)
+                changed = True
+
+        if changed:
+            audio_file.save()
         return True
     except Exception as e:
         print(f"Error repairing {file_path}: {e}")
@@ -1363,48 +1877,57 @@ def repair_ogg_metadata(
         
         if audio_file is None:
             return False
-        
-        # Set metadata tags (OGG uses Vorbis comment format)
-        if 'title' in metadata:
-            audio_file['TITLE'] = metadata['title']
-        
+
+        # Only save when a tag actually changes (see repair_mp3_metadata)
+        changed = False
+
+        # Set metadata tags (OGG uses Vorbis comment format; title resolved
+        # against the nfo's canonical track list first)
+        title = _resolve_title(metadata, album_metadata)
+        if title is not None:
+            changed |= _update_tag(audio_file, 'TITLE', title)
+
         if 'artist' in metadata:
-            audio_file['ARTIST'] = metadata['artist']
-        
+            changed |= _update_tag(audio_file, 'ARTIST', metadata['artist'])
+
         if 'album' in metadata:
-            audio_file['ALBUM'] = metadata['album']
-        
+            changed |= _update_tag(audio_file, 'ALBUM', metadata['album'])
+
         if 'tracknumber' in metadata:
-            audio_file['TRACKNUMBER'] = str(metadata['tracknumber'])
-        
+            changed |= _update_tag(audio_file, 'TRACKNUMBER', str(metadata['tracknumber']))
+
         # Use album metadata if available
         if album_metadata:
             if album_metadata.get('album') and not metadata.get('album'):
-                audio_file['ALBUM'] = album_metadata['album']
-            
+                changed |= _update_tag(audio_file, 'ALBUM', album_metadata['album'])
+
             if album_metadata.get('albumartist'):
-                audio_file['ALBUMARTIST'] = album_metadata['albumartist']
+                changed |= _update_tag(audio_file, 'ALBUMARTIST', album_metadata['albumartist'])
             elif album_metadata.get('artist'):
-                audio_file['ALBUMARTIST'] = album_metadata['artist']
-            
+                changed |= _update_tag(audio_file, 'ALBUMARTIST', album_metadata['artist'])
+
             if album_metadata.get('year'):
-                audio_file['DATE'] = album_metadata['year']
-            
+                changed |= _update_tag(audio_file, 'DATE', album_metadata['year'])
+
             if album_metadata.get('genre'):
-                audio_file['GENRE'] = album_metadata['genre']
-            
-            # Update track title from album.nfo if available
-            if 'tracknumber' in metadata:
-                track_num = metadata['tracknumber']
-                if track_num in album_metadata.get('tracks', {}):
-                    audio_file['TITLE'] = album_metadata['tracks'][track_num]
-        
-        audio_file.save()
-        
-        # Embed album art if provided
+                changed |= _update_tag(audio_file, 'GENRE', album_metadata['genre'])
+
+        # Embed album art on the already-open file; going through
+        # embed_album_art_ogg would re-open and re-save it
         if album_art:
-            mime_type = detect_mime_type(album_art)
-            embed_album_art_ogg(file_path, album_art, mime_type)
+            picture = Picture()
+            picture.type = 3  # Cover front
+            picture.mime = detect_mime_type(album_art)
+            picture.data = album_art
+            encoded = base64.b64encode(picture.write()).decode('ascii')
+            if audio_file.get('metadata_block_picture') != [encoded]:
+                if 'METADATA_BLOCK_PICTURE' in audio_file:
+                    del audio_file['METADATA_BLOCK_PICTURE']
+                audio_file['metadata_block_picture'] = [encoded]
+                changed = True
+
+        if changed:
+            audio_file.save()
         return True
     except Exception as e:
         print(f"Error repairing {file_path}: {e}")
@@ -1431,72 +1954,108 @@ def repair_mp4_metadata(
     """
     try:
         audio_file = MP4(str(file_path))
-        
-        # Set metadata tags
-        if 'title' in metadata:
-            audio_file['\xa9nam'] = metadata['title']  # Title
-        
+
+        # Only save when a tag actually changes (see repair_mp3_metadata)
+        changed = False
+
+        # Set metadata tags (title resolved against the nfo's canonical
+        # track list first)
+        title = _resolve_title(metadata, album_metadata)
+        if title is not None:
+            changed |= _update_tag(audio_file, '\xa9nam', title)  # Title
+
         if 'artist' in metadata:
-            audio_file['\xa9ART'] = metadata['artist']  # Artist
-        
+            changed |= _update_tag(audio_file, '\xa9ART', metadata['artist'])  # Artist
+
         if 'album' in metadata:
-            audio_file['\xa9alb'] = metadata['album']  # Album
-        
+            changed |= _update_tag(audio_file, '\xa9alb', metadata['album'])  # Album
+
         if 'tracknumber' in metadata:
-            audio_file['trkn'] = [(metadata['tracknumber'], 0)]  # Track number, total tracks
-        
+            changed |= _update_tag(audio_file, 'trkn', [(metadata['tracknumber'], 0)])  # Track number, total tracks
+
         # Use album metadata if available
         if album_metadata:
             if album_metadata.get('album') and not metadata.get('album'):
-                audio_file['\xa9alb'] = album_metadata['album']
-            
+                changed |= _update_tag(audio_file, '\xa9alb', album_metadata['album'])
+
             if album_metadata.get('albumartist'):
-                audio_file['aART'] = album_metadata['albumartist']  # Album Artist
+                changed |= _update_tag(audio_file, 'aART', album_metadata['albumartist'])  # Album Artist
             elif album_metadata.get('artist'):
-                audio_file['aART'] = album_metadata['artist']
-            
+                changed |= _update_tag(audio_file, 'aART', album_metadata['artist'])
+
             if album_metadata.get('year'):
-                audio_file['\xa9day'] = album_metadata['year']  # Date/Year
-            
+                changed |= _update_tag(audio_file, '\xa9day', album_metadata['year'])  # Date/Year
+
             if album_metadata.get('genre'):
-                audio_file['\xa9gen'] = album_metadata['genre']  # Genre
-            
-            # Update track title from album.nfo if available
-            if 'tracknumber' in metadata:
-                track_num = metadata['tracknumber']
-                if track_num in album_metadata.get('tracks', {}):
-                    audio_file['\xa9nam'] = album_metadata['tracks'][track_num]
-        
-        audio_file.save()
-        
-        # Embed album art if provided
+                changed |= _update_tag(audio_file, '\xa9gen', album_metadata['genre'])  # Genre
+
+        # Embed album art on the already-open file; going through
+        # embed_album_art_mp4 would re-open and re-save it
         if album_art:
-            embed_album_art_mp4(file_path, album_art)
+            existing = audio_file.get('covr')
+            if not (existing and bytes(existing[0]) == album_art):
+                mime_type = detect_mime_type(album_art)
+                image_format = MP4Cover.FORMAT_PNG if 'png' in mime_type else MP4Cover.FORMAT_JPEG
+                audio_file['covr'] = [MP4Cover(album_art, imageformat=image_format)]
+                changed = True
+
+        if changed:
+            audio_file.save()
         return True
     except Exception as e:
         print(f"Error repairing {file_path}: {e}")
         return False
 
 
-def repair_audio_file(file_path: Path, base_dir: Path, album_art_cache: Dict[str, Optional[bytes]], 
-                      log_data: Dict, log_file: Path) -> Tuple[bool, Optional[Dict]]:
+@functools.lru_cache(maxsize=1024)
+def _parse_nfo_cached(nfo_path_str: str, mtime_ns: int) -> Optional[Dict]:
+    """parse_album_nfo memoized on (path, mtime); tracks of an album share one parse."""
+    return parse_album_nfo(Path(nfo_path_str))
+
+
+def _album_nfo_metadata(directory: Path) -> Optional[Dict]:
+    """
+    Album metadata from the directory's album.nfo, parsed at most once per
+    (path, mtime). One stat covers the existence check and the cache key,
+    and an edited nfo re-parses automatically because the mtime changes.
+    """
+    nfo_path = directory / 'album.nfo'
+    try:
+        st = os.stat(nfo_path)
+    except OSError:
+        return None
+    return _parse_nfo_cached(str(nfo_path), st.st_mtime_ns)
+
+
+# Suffix-to-repair-function dispatch; one dict lookup replaces the
+# per-file chain of suffix comparisons
+_REPAIR_DISPATCH = {
+    '.mp3': repair_mp3_metadata,
+    '.flac': repair_flac_metadata,
+    '.ogg': repair_ogg_metadata,
+    '.opus': repair_ogg_metadata,
+    '.m4a': repair_mp4_metadata,
+    '.mp4': repair_mp4_metadata,
+}
+
+
+def repair_audio_file(file_path: Path, base_dir: Path, album_art_cache: Dict[str, Optional[bytes]],
+                      log_data: Dict, log_file: Path) -> Tuple[bool, Optional[TrackInfo]]:
     """
     Repair metadata for a single audio file.
-    
+
     Returns:
-        tuple: (success: bool, metadata: Optional[Dict]) where metadata contains
-               album directory path, album metadata, and track info for nfo generation
+        tuple: (success: bool, info: Optional[TrackInfo]) where info carries
+               the album directory, album metadata, and track data for nfo generation
     """
     # Check if file has already been processed
     if is_file_processed(file_path, log_data):
         print(f"  ⊘ Already processed (skipping)")
         return True, None
     
-    # Check if album.nfo exists in the same directory
-    album_nfo_path = file_path.parent / 'album.nfo'
-    album_metadata = None
-    if album_nfo_path.exists():
-        album_metadata = parse_album_nfo(album_nfo_path)
+    # Album metadata from album.nfo, parsed once per directory rather
+    # than once per track
+    album_metadata = _album_nfo_metadata(file_path.parent)
     
     # Parse filename to extract metadata
     filename_metadata = parse_filename(file_path.name)
@@ -1515,36 +2074,41 @@ def repair_audio_file(file_path: Path, base_dir: Path, album_art_cache: Dict[str
     
     if artist and album:
         album_key = f"{artist}||{album}"
-        
-        # Check log first to see if we've already tried to download art for this album
-        if has_album_art_downloaded(artist, album, log_data):
-            # Check if we have it in cache from this session
-            if album_key in album_art_cache:
-                album_art = album_art_cache[album_key]
-                if album_art:
-                    print(f"  ✓ Using cached album art")
-                else:
-                    print(f"  ⊘ Album art download previously failed (skipping)")
+
+        # Session cache first: it holds art bytes and memoized negative
+        # results alike, so later tracks of an album with no art short-circuit
+        # here instead of re-reaching the log check or the download lock. One
+        # get() call, because a membership check followed by indexing can
+        # straddle another worker's eviction and raise KeyError.
+        cached = album_art_cache.get(album_key, _ART_CACHE_MISS)
+        if cached is not _ART_CACHE_MISS:
+            album_art = cached
+            if album_art:
+                print(f"  ✓ Using cached album art")
             else:
-                # We tried before but don't have it cached, so skip download
-                print(f"  ⊘ Album art already attempted (skipping download)")
-                album_art = None
+                print(f"  ⊘ Album art download previously failed (skipping)")
+        elif has_album_art_downloaded(artist, album, log_data):
+            # Downloaded in an earlier session but not cached now, so skip
+            print(f"  ⊘ Album art already attempted (skipping download)")
+            album_art = None
+        elif not should_retry_album_art(artist, album, log_data):
+            # A recent attempt already failed; memoize the miss for this
+            # session so later tracks short-circuit at the cache check
+            print(f"  ⊘ Album art lookup failed recently (skipping retry)")
+            album_art_cache[album_key] = None
         else:
-            # Check cache first (in case we downloaded it earlier in this session)
-            if album_key not in album_art_cache:
-                print(f"  Downloading album art for: {artist} - {album}")
-                musicbrainz_id = album_metadata.get('musicbrainz_release_group_id') if album_metadata else None
-                album_art_data, found_mb_id = get_album_art(artist, album, musicbrainz_id)
-                album_art_cache[album_key] = album_art_data
-                # Mark in log that we attempted download, store MusicBrainz ID if found
-                mark_album_art_downloaded(artist, album, log_data, album_art_data is not None, found_mb_id)
-                # Save log after each album art download attempt
-                save_log(log_data, log_file)
-                # Respect API rate limits
-                time.sleep(API_RATE_LIMIT_DELAY)
-                album_art = album_art_data
-            else:
-                album_art = album_art_cache[album_key]
+            # Populate the cache under the key's lock stripe so concurrent
+            # workers racing on the same album download it only once
+            with _art_cache_lock(album_key):
+                album_art = album_art_cache.get(album_key, _ART_CACHE_MISS)
+                if album_art is _ART_CACHE_MISS:
+                    print(f"  Downloading album art for: {artist} - {album}")
+                    musicbrainz_id = album_metadata.get('musicbrainz_release_group_id') if album_metadata else None
+                    album_art_data, found_mb_id = get_album_art(artist, album, musicbrainz_id)
+                    album_art_cache[album_key] = album_art_data
+                    # Mark in log that we attempted download, store MusicBrainz ID if found
+                    mark_album_art_downloaded(artist, album, log_data, album_art_data is not None, found_mb_id)
+                    album_art = album_art_data
             
             if album_art:
                 print(f"  ✓ Found album art")
@@ -1552,31 +2116,23 @@ def repair_audio_file(file_path: Path, base_dir: Path, album_art_cache: Dict[str
                 print(f"  ⚠ No album art found")
     
     # Repair based on file type
-    success = False
-    suffix = file_path.suffix.lower()
-    
-    if suffix == '.mp3':
-        success = repair_mp3_metadata(file_path, metadata, album_metadata, album_art)
-    elif suffix == '.flac':
-        success = repair_flac_metadata(file_path, metadata, album_metadata, album_art)
-    elif suffix in ('.ogg', '.opus'):
-        success = repair_ogg_metadata(file_path, metadata, album_metadata, album_art)
-    elif suffix in ('.m4a', '.mp4'):
-        success = repair_mp4_metadata(file_path, metadata, album_metadata, album_art)
-    else:
+    repair_func = _REPAIR_DISPATCH.get(file_path.suffix.lower())
+    if repair_func is None:
         print(f"Unsupported file type: {file_path.suffix}")
         return False, None
+
+    success = repair_func(file_path, metadata, album_metadata, album_art)
     
-    # Mark file as processed if successful
+    # Mark file as processed if successful; the caller persists log_data
+    # once per album rather than after every file
     if success:
         mark_file_processed(file_path, log_data, has_art=(album_art is not None))
-        save_log(log_data, log_file)
-        
-        # Return metadata for nfo generation if we have album info
+
+        # Return track info for nfo generation if we have album info
         if artist and album:
-            return success, {
-                'album_dir': file_path.parent,
-                'album_metadata': {
+            return success, TrackInfo(
+                album_dir=str(file_path.parent),
+                album_metadata={
                     'album': album,
                     'artist': artist,
                     'albumartist': album_metadata.get('albumartist', artist) if album_metadata else artist,
@@ -1584,9 +2140,9 @@ def repair_audio_file(file_path: Path, base_dir: Path, album_art_cache: Dict[str
                     'genre': album_metadata.get('genre', '') if album_metadata else '',
                     'musicbrainz_release_group_id': album_metadata.get('musicbrainz_release_group_id', '') if album_metadata else ''
                 },
-                'track_number': metadata.get('tracknumber'),
-                'track_title': metadata.get('title', '')
-            }
+                track_number=metadata.get('tracknumber'),
+                track_title=metadata.get('title', '')
+            )
     
     return success, None
 